@@ -1,6 +1,9 @@
 """Shared FastAPI dependencies for StoryOS."""
 from __future__ import annotations
 
+import threading
+from typing import Dict, Tuple
+
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 
@@ -22,11 +25,25 @@ def get_settings_dep() -> Settings:
     return get_settings()
 
 
+# One AuthService (and its role cache) per settings/database pair. Keyed on the
+# injected objects so dependency overrides get their own instance instead of the
+# one built for the first request. Settings isn't hashable, hence the id() keys;
+# the cached service keeps both objects alive, so the ids can't be reused.
+_auth_services: Dict[Tuple[int, int], AuthService] = {}
+_auth_services_lock = threading.Lock()
+
+
 def get_auth_service(
     settings: Settings = Depends(get_settings_dep),
     db_manager: DatabaseManager = Depends(get_db_manager_dep),
 ) -> AuthService:
-    return AuthService(settings=settings, db_manager=db_manager)
+    key = (id(settings), id(db_manager))
+    with _auth_services_lock:
+        service = _auth_services.get(key)
+        if service is None:
+            service = AuthService(settings=settings, db_manager=db_manager)
+            _auth_services[key] = service
+    return service
 
 
 def get_game_service(
@@ -6,9 +6,11 @@ from typing import Any, Dict, List
 from fastapi import APIRouter, Depends, HTTPException, status
 from pydantic import BaseModel
 
-from backend.api.dependencies import get_db_manager_dep, require_admin
+from backend.api.dependencies import get_auth_service, get_db_manager_dep, require_admin
 from backend.logging_config import get_logger
+from backend.services.auth_service import AuthService
 from backend.utils.db_utils import DatabaseManager
+from backend.utils.system_prompt_manager import invalidate_system_prompt_cache
 
 logger = get_logger(__name__)
 router = APIRouter()
@@ -32,7 +34,7 @@ async def get_stats(
 ) -> Dict[str, Any]:
     logger.info(f"GET /api/admin/stats - Stats request by admin user_id={admin['user_id']}")
     user_count = db_manager.get_user_count()
-    scenario_count = len(db_manager.get_all_scenarios())
+    scenario_count = db_manager.get_scenario_count()
     session_count = 0
     if db_manager.db is not None:
         session_count = db_manager.db.active_game_sessions.count_documents({})
@@ -67,6 +69,7 @@ async def update_user_role(
     payload: UserRoleUpdate,
     admin: dict = Depends(require_admin),
     db_manager: DatabaseManager = Depends(get_db_manager_dep),
+    auth_service: AuthService = Depends(get_auth_service),
 ) -> Dict[str, Any]:
     """Update a user's role"""
     logger.info(f"PUT /api/admin/users/{user_id}/role - Update user role request by admin user_id={admin['user_id']}, new_role={payload.role}")
@@ -95,6 +98,7 @@ async def update_user_role(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to update user role",
         )
+    auth_service.invalidate_user_role(user_id)
 
     # Return updated user
     updated_user = db_manager.get_user(user_id)
@@ -158,18 +162,18 @@ async def update_story_prompt(
                 detail="Story system prompt not found",
             )
 
-        # Update the prompt
-        success = db_manager.update_system_prompt(prompt["_id"], payload.content)
-        if not success:
+        # Update the prompt; the updated document comes back from the same write
+        updated_prompt = db_manager.update_system_prompt(prompt["_id"], payload.content)
+        if not updated_prompt:
             logger.error(f"PUT /api/admin/system-prompts/story - Failed to update story system prompt")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update story system prompt",
             )
 
-        # Return updated prompt
-        updated_prompt = db_manager.get_active_system_prompt()
-        if updated_prompt and "_id" in updated_prompt:
+        invalidate_system_prompt_cache()
+
+        if "_id" in updated_prompt:
             updated_prompt["_id"] = str(updated_prompt["_id"])
         logger.info(f"PUT /api/admin/system-prompts/story - Successfully updated story system prompt")
         return updated_prompt
@@ -193,20 +197,16 @@ async def update_visualization_prompt(
     """Update visualization system prompt"""
     logger.info(f"PUT /api/admin/system-prompts/visualization - Update visualization prompt request by admin user_id={admin['user_id']}")
     try:
-        success = db_manager.update_visualization_system_prompt(payload.content)
-        if not success:
+        viz_prompt_doc = db_manager.update_visualization_system_prompt(payload.content)
+        invalidate_system_prompt_cache()
+        if not viz_prompt_doc:
             logger.error(f"PUT /api/admin/system-prompts/visualization - Failed to update visualization system prompt")
             raise HTTPException(
                 status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
                 detail="Failed to update visualization system prompt",
             )
 
-        # Return updated prompt
-        viz_prompt_doc = db_manager.system_prompt_actions.db.system_prompts.find_one({
-            'active': True,
-            'name': 'Default StoryOS Visualization System Prompt'
-        })
-        if viz_prompt_doc and "_id" in viz_prompt_doc:
+        if "_id" in viz_prompt_doc:
             viz_prompt_doc["_id"] = str(viz_prompt_doc["_id"])
         logger.info(f"PUT /api/admin/system-prompts/visualization - Successfully updated visualization system prompt")
         return viz_prompt_doc
@@ -61,7 +61,6 @@ async def register(
     authorization: str | None = Header(default=None),
 ) -> AuthResponse:
     logger.info(f"POST /api/auth/register - Registration attempt for username={payload.username}")
-    user_count = auth_service.db_manager.get_user_count()
     token = _extract_bearer_token(authorization) if authorization else None
 
     # Check if this is an admin creating a user
@@ -75,15 +74,17 @@ async def register(
         except:
             pass
 
-    if user_count == 0:
-        # Force the very first user to become an admin
-        if payload.role == "user" or payload.role == "pending":
-            payload.role = "admin"  # type: ignore[assignment]
-        logger.info(f"POST /api/auth/register - First user registration, setting role=admin for username={payload.username}")
-    elif not is_admin_creating:
-        # Public registration - force role to pending
-        payload.role = "pending"  # type: ignore[assignment]
-        logger.info(f"POST /api/auth/register - Public registration, setting role=pending for username={payload.username}")
+    # With an admin creating the user this can't be the first one, so skip the user count
+    if not is_admin_creating:
+        if auth_service.db_manager.get_user_count() == 0:
+            # Force the very first user to become an admin
+            if payload.role == "user" or payload.role == "pending":
+                payload.role = "admin"  # type: ignore[assignment]
+            logger.info(f"POST /api/auth/register - First user registration, setting role=admin for username={payload.username}")
+        else:
+            # Public registration - force role to pending
+            payload.role = "pending"  # type: ignore[assignment]
+            logger.info(f"POST /api/auth/register - Public registration, setting role=pending for username={payload.username}")
 
     auth_service.register_user(payload.username, payload.password, payload.role)
     logger.info(f"POST /api/auth/register - Successfully registered username={payload.username}, role={payload.role}")
@@ -2,9 +2,9 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, Iterable, List
+from typing import Any, Dict, List, Optional
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
 
 from backend.api.dependencies import (
     get_current_user,
@@ -21,25 +21,18 @@ from backend.api.schemas import (
 )
 from backend.logging_config import get_logger
 from backend.models.message import Message
-from backend.services.game_service import GameService
+from backend.services.game_service import SESSION_PAGE_SIZE, GameService
 from backend.utils.db_utils import DatabaseManager
+from backend.utils.game_session_manager import (
+    invalidate_user_session_index,
+    remove_from_user_session_index,
+)
 from backend.utils.visualization_utils import VisualizationManager
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
-def _normalise_sessions(raw_sessions: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
-    sessions: List[Dict[str, Any]] = []
-    for session in raw_sessions:
-        normalised = dict(session)
-        session_id = normalised.pop("_id", None)
-        if session_id is not None:
-            normalised["_id"] = str(session_id)
-        sessions.append(normalised)
-    return sessions
-
-
 @router.post("/sessions")
 async def create_game_session(
     data: GameSessionCreate,
@@ -60,23 +53,36 @@ async def create_game_session(
 
 @router.get("/sessions", response_model=SessionListResponse)
 async def list_user_sessions(
+    page: Optional[int] = Query(default=None, ge=1),
+    page_size: int = Query(default=SESSION_PAGE_SIZE, ge=1, le=100),
     current_user: dict = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service),
 ) -> SessionListResponse:
-    logger.info(f"GET /api/game/sessions - List sessions request for user_id={current_user['user_id']}")
-    sessions = await game_service.list_user_sessions(current_user["user_id"])
-    logger.info(f"GET /api/game/sessions - Returning {len(sessions)} sessions for user_id={current_user['user_id']}")
-    return SessionListResponse(sessions=_normalise_sessions(sessions))
+    logger.info(f"GET /api/game/sessions - List sessions request for user_id={current_user['user_id']}, page={page}")
+    sessions, total = await game_service.list_user_sessions(
+        current_user["user_id"], page=page, page_size=page_size
+    )
+    logger.info(f"GET /api/game/sessions - Returning {len(sessions)} of {total} sessions for user_id={current_user['user_id']}")
+    if page is None:
+        return SessionListResponse(sessions=[summary.to_dict() for summary in sessions], total=total)
+    return SessionListResponse(
+        sessions=[summary.to_dict() for summary in sessions],
+        total=total,
+        page=page,
+        page_size=page_size,
+    )
 
 
 @router.get("/sessions/{session_id}", response_model=GameSessionEnvelope)
 async def get_session(
     session_id: str,
+    message_limit: Optional[int] = Query(default=None, ge=1),
     current_user: dict = Depends(get_current_user),
     game_service: GameService = Depends(get_game_service),
 ) -> GameSessionEnvelope:
     logger.info(f"GET /api/game/sessions/{session_id} - Load session request by user_id={current_user['user_id']}")
-    data = await game_service.load_session(session_id)
+    # With message_limit only the newest messages are read from MongoDB
+    data = await game_service.load_session(session_id, message_limit=message_limit)
     session = data["session"]
     if session.user_id != current_user["user_id"]:
         logger.warning(f"GET /api/game/sessions/{session_id} - Access denied for user_id={current_user['user_id']}")
@@ -85,18 +91,8 @@ async def get_session(
             detail="Access denied",
         )
 
-    raw_messages = data.get("messages", [])
-    messages: List[Message] = []
-    for message in raw_messages:
-        if isinstance(message, Message):
-            messages.append(message)
-        elif isinstance(message, dict):
-            messages.append(Message.from_dict(message))
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Encountered unsupported message payload",
-            )
+    # get_chat_messages already returns Message objects
+    messages: List[Message] = data.get("messages", [])
 
     logger.info(f"GET /api/game/sessions/{session_id} - Returning session with {len(messages)} messages for user_id={current_user['user_id']}")
     return GameSessionEnvelope(session=session, messages=messages)
@@ -115,32 +111,15 @@ async def visualize_prompt(
     db_manager: DatabaseManager = Depends(get_db_manager_dep),
 ) -> VisualizationResult:
     logger.info(f"POST /api/game/sessions/{session_id}/messages/{message_id}/visualize - Visualization request by user_id={current_user['user_id']}, prompt={payload.prompt[:50]}...")
-    data = await game_service.load_session(session_id)
-    session = data["session"]
-    if session.user_id != current_user["user_id"]:
+    if not await game_service.user_owns_session(current_user["user_id"], session_id):
         logger.warning(f"POST /api/game/sessions/{session_id}/messages/{message_id}/visualize - Access denied for user_id={current_user['user_id']}")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Access denied",
         )
 
-    raw_messages = data.get("messages", [])
-    messages: List[Message] = []
-    for message in raw_messages:
-        if isinstance(message, Message):
-            messages.append(message)
-        elif isinstance(message, dict):
-            messages.append(Message.from_dict(message))
-        else:
-            raise HTTPException(
-                status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-                detail="Encountered unsupported message payload",
-            )
-
-    target = next(
-        (msg for msg in messages if (msg.message_id or "") == message_id),
-        None,
-    )
+    # Only the clicked message is needed, not the session and its whole chat history
+    target = await asyncio.to_thread(db_manager.get_chat_message, session_id, message_id)
     if target is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -207,10 +186,7 @@ async def update_game_speed(
     db_manager: DatabaseManager = Depends(get_db_manager_dep),
 ) -> Dict[str, Any]:
     logger.info(f"PATCH /api/game/sessions/{session_id}/game-speed - Update game speed request by user_id={current_user['user_id']}, new_speed={speed_update.game_speed}")
-    data = await game_service.load_session(session_id)
-    session = data["session"]
-
-    if session.user_id != current_user["user_id"]:
+    if not await game_service.user_owns_session(current_user["user_id"], session_id):
         logger.warning(f"PATCH /api/game/sessions/{session_id}/game-speed - Access denied for user_id={current_user['user_id']}")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -218,6 +194,7 @@ async def update_game_speed(
         )
 
     success = db_manager.update_game_session_fields(session_id, {"game_speed": speed_update.game_speed})
+    invalidate_user_session_index(current_user["user_id"])
 
     if not success:
         logger.error(f"PATCH /api/game/sessions/{session_id}/game-speed - Failed to update game speed for session_id={session_id}")
@@ -239,11 +216,8 @@ async def delete_game_session(
 ) -> Dict[str, str]:
     """Soft delete a game session and all its related data (chats, visualizations)"""
     logger.info(f"DELETE /api/game/sessions/{session_id} - Delete session request by user_id={current_user['user_id']}")
-    # Load session to verify ownership
-    data = await game_service.load_session(session_id)
-    session = data["session"]
-
-    if session.user_id != current_user["user_id"]:
+    # Verify ownership
+    if not await game_service.user_owns_session(current_user["user_id"], session_id):
         logger.warning(f"DELETE /api/game/sessions/{session_id} - Access denied for user_id={current_user['user_id']}")
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
@@ -258,6 +232,7 @@ async def delete_game_session(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail="Failed to delete game session",
         )
+    remove_from_user_session_index(current_user["user_id"], session_id)
 
     # Soft delete related chat document
     chat_deleted = db_manager.delete_chat(session_id)
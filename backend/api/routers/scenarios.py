@@ -1,46 +1,63 @@
 """Scenario management API routes."""
 from __future__ import annotations
 
-from typing import List
+import asyncio
+from typing import List, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
 from backend.api.dependencies import get_current_user, get_db_manager_dep, require_admin
-from backend.api.schemas import ScenarioPayload, ScenarioUpdate
+from backend.api.schemas import ScenarioPayload, ScenarioSummary, ScenarioUpdate
 from backend.logging_config import get_logger
 from backend.models.scenario import Scenario
 from backend.utils.db_utils import DatabaseManager
+from backend.utils.scenario_manager import (
+    get_cached_scenario,
+    get_visible_scenario_summaries,
+    get_visible_scenarios,
+    invalidate_scenario_cache,
+)
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
+def _visibility_scope(current_user: dict) -> Optional[str]:
+    """Admins see all scenarios (None), regular users see public and their own"""
+    if current_user.get("role", "user") == "admin":
+        return None
+    return current_user.get("user_id")
+
+
 @router.get("/")
 async def list_scenarios(
     current_user: dict = Depends(get_current_user),
-    db_manager: DatabaseManager = Depends(get_db_manager_dep),
 ) -> List[Scenario]:
     user_id = current_user.get("user_id")
-    user_role = current_user.get("role", "user")
-    logger.info(f"GET /api/scenarios - List scenarios request by user_id={user_id}, role={user_role}")
+    logger.info(f"GET /api/scenarios - List scenarios request by user_id={user_id}, role={current_user.get('role', 'user')}")
 
-    # Admins see all scenarios, regular users see filtered scenarios
-    if user_role == "admin":
-        scenarios = db_manager.get_all_scenarios(user_id=None)
-    else:
-        scenarios = db_manager.get_all_scenarios(user_id=user_id)
+    scenarios = await asyncio.to_thread(get_visible_scenarios, _visibility_scope(current_user))
 
     logger.info(f"GET /api/scenarios - Returning {len(scenarios)} scenarios for user_id={user_id}")
     return scenarios
 
 
+@router.get("/summaries", response_model=List[ScenarioSummary])
+async def list_scenario_summaries(
+    current_user: dict = Depends(get_current_user),
+) -> List[dict]:
+    """List visible scenarios without their prompts or storyline"""
+    logger.info(f"GET /api/scenarios/summaries - List scenario summaries request by user_id={current_user.get('user_id')}")
+
+    return await asyncio.to_thread(get_visible_scenario_summaries, _visibility_scope(current_user))
+
+
 @router.get("/{scenario_id}")
 async def get_scenario(
     scenario_id: str,
-    db_manager: DatabaseManager = Depends(get_db_manager_dep),
 ) -> Scenario:
     logger.info(f"GET /api/scenarios/{scenario_id} - Get scenario request")
-    scenario = db_manager.get_scenario(scenario_id)
+    scenario = await asyncio.to_thread(get_cached_scenario, scenario_id)
     if not scenario:
         logger.warning(f"GET /api/scenarios/{scenario_id} - Scenario not found")
         raise HTTPException(
@@ -60,7 +77,8 @@ async def create_scenario(
     logger.info(f"POST /api/scenarios - Create scenario request by user_id={current_user['user_id']}, scenario_id={payload.scenario_id}")
     # Convert payload to Scenario model
     scenario = Scenario(**payload.model_dump())
-    created = db_manager.create_scenario(scenario)
+    created = await asyncio.to_thread(db_manager.create_scenario, scenario)
+    invalidate_scenario_cache(scenario)
     if not created:
         logger.error(f"POST /api/scenarios - Failed to create scenario scenario_id={payload.scenario_id}")
         raise HTTPException(
@@ -68,17 +86,9 @@ async def create_scenario(
             detail="Failed to create scenario",
         )
 
-    # Retrieve the created scenario to return
-    created_scenario = db_manager.get_scenario(scenario.scenario_id)
-    if not created_scenario:
-        logger.error(f"POST /api/scenarios - Failed to retrieve created scenario scenario_id={payload.scenario_id}")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve created scenario",
-        )
-
     logger.info(f"POST /api/scenarios - Successfully created scenario scenario_id={payload.scenario_id}")
-    return created_scenario
+    # The stored document is exactly this model, so return it without re-reading
+    return scenario
 
 
 @router.put("/{scenario_id}")
@@ -90,7 +100,7 @@ async def update_scenario(
 ) -> Scenario:
     logger.info(f"PUT /api/scenarios/{scenario_id} - Update scenario request by user_id={current_user['user_id']}")
     # Get the existing scenario
-    existing_scenario = db_manager.get_scenario(scenario_id)
+    existing_scenario = await asyncio.to_thread(db_manager.get_scenario, scenario_id)
     if not existing_scenario:
         logger.warning(f"PUT /api/scenarios/{scenario_id} - Scenario not found")
         raise HTTPException(
@@ -113,7 +123,8 @@ async def update_scenario(
     updated_scenario = Scenario(**updated_scenario_dict)
 
     # Update in database
-    success = db_manager.update_scenario(updated_scenario)
+    success = await asyncio.to_thread(db_manager.update_scenario, updated_scenario)
+    invalidate_scenario_cache(existing_scenario, updated_scenario)
     if not success:
         logger.error(f"PUT /api/scenarios/{scenario_id} - Failed to update scenario")
         raise HTTPException(
@@ -121,17 +132,9 @@ async def update_scenario(
             detail="Failed to update scenario",
         )
 
-    # Retrieve and return the updated scenario
-    result = db_manager.get_scenario(scenario_id)
-    if not result:
-        logger.error(f"PUT /api/scenarios/{scenario_id} - Failed to retrieve updated scenario")
-        raise HTTPException(
-            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            detail="Failed to retrieve updated scenario",
-        )
-
     logger.info(f"PUT /api/scenarios/{scenario_id} - Successfully updated scenario")
-    return result
+    # update_scenario $sets the full model, so it already matches the stored document
+    return updated_scenario
 
 
 __all__ = ["router"]
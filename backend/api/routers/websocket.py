@@ -3,7 +3,8 @@ from __future__ import annotations
 
 import asyncio
 import json
-from typing import Dict, Set
+import time
+from typing import AsyncIterator, Dict, Set
 
 from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.websockets import WebSocket, WebSocketDisconnect
@@ -16,6 +17,10 @@ from backend.services.game_service import GameService
 logger = get_logger(__name__)
 router = APIRouter()
 
+# LLM streams arrive a few characters at a time; buffer them into fewer frames.
+STORY_CHUNK_FLUSH_CHARS = 64
+STORY_CHUNK_FLUSH_SECONDS = 0.05
+
 
 class GameWebSocketManager:
     """Maintain active websocket connections per session."""
@@ -80,7 +85,11 @@ async def _ensure_session_membership(
     user_id: str,
 ) -> None:
     """Verify user has access to session without loading all messages (fast check)."""
-    # Get only the session metadata, not the full chat history
+    # Owners are confirmed from the cached session index; only a miss needs the
+    # session document to tell a missing session from someone else's
+    if await game_service.user_owns_session(user_id, session_id):
+        return
+
     session = await asyncio.to_thread(
         game_service.db_manager.game_session_actions.get_game_session,
         session_id
@@ -161,10 +170,50 @@ async def game_websocket(
         raise
 
 
+async def _coalesce_chunks(chunks: AsyncIterator[str]) -> AsyncIterator[str]:
+    """Merge small streamed chunks so each websocket frame carries more text.
+
+    Buffered text is flushed once it reaches STORY_CHUNK_FLUSH_CHARS or has waited
+    STORY_CHUNK_FLUSH_SECONDS, whether or not the source has produced another chunk.
+    """
+    iterator = chunks.__aiter__()
+    buffer: list[str] = []
+    buffered = 0
+    flush_at = 0.0
+    # Kept across timeouts: cancelling a pending __anext__ would close the source
+    next_chunk = asyncio.ensure_future(iterator.__anext__())
+    try:
+        while True:
+            timeout = max(flush_at - time.monotonic(), 0.0) if buffer else None
+            done, _ = await asyncio.wait({next_chunk}, timeout=timeout)
+            if not done:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+                continue
+            try:
+                chunk = next_chunk.result()
+            except StopAsyncIteration:
+                break
+            if not buffer:
+                flush_at = time.monotonic() + STORY_CHUNK_FLUSH_SECONDS
+            buffer.append(chunk)
+            buffered += len(chunk)
+            if buffered >= STORY_CHUNK_FLUSH_CHARS:
+                yield "".join(buffer)
+                buffer.clear()
+                buffered = 0
+            next_chunk = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        next_chunk.cancel()
+    if buffer:
+        yield "".join(buffer)
+
+
 async def _stream_initial_story(session_id: str, game_service: GameService) -> None:
     # Initial story generation
     await manager.send_json(session_id, {"type": "status_update", "message": "StoryOS is generating the next chapter…"})
-    async for chunk in game_service.stream_initial_story_with_phases(session_id):
+    async for chunk in _coalesce_chunks(game_service.stream_initial_story_with_phases(session_id)):
         await manager.send_json(
             session_id,
             {"type": "story_chunk", "content": chunk},
@@ -186,8 +235,8 @@ async def _stream_player_input(
     await manager.send_json(session_id, {"type": "status_update", "message": "StoryOS is responding to your action…"})
 
     # Stream with automatic phase notifications
-    async for chunk in game_service.stream_player_input_with_phases(
-        session_id, content, phase_callback
+    async for chunk in _coalesce_chunks(
+        game_service.stream_player_input_with_phases(session_id, content, phase_callback)
     ):
         await manager.send_json(
             session_id,
@@ -1,7 +1,7 @@
 """Pydantic schemas for API requests and responses."""
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -52,6 +52,9 @@ class GameSessionEnvelope(BaseModel):
 
 class SessionListResponse(BaseModel):
     sessions: List[Dict[str, Any]]
+    total: Optional[int] = None
+    page: Optional[int] = None
+    page_size: Optional[int] = None
 
 
 class HealthResponse(BaseModel):
@@ -67,6 +70,17 @@ class ScenarioPayload(BaseModel):
         extra = "allow"
 
 
+class ScenarioSummary(BaseModel):
+    """Lightweight scenario listing; the full scenario is fetched when one is opened."""
+
+    scenario_id: str
+    name: str
+    description: str
+    author: str
+    visibility: str
+    version: Union[int, str]
+
+
 class ScenarioUpdate(BaseModel):
     name: Optional[str] = None
     description: Optional[str] = None
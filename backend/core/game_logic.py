@@ -9,9 +9,12 @@ import json
 import logging
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import Any, Callable, Dict, Generator, Optional
 
+from bson import ObjectId
+
 from backend.logging_config import StoryOSLogger, get_logger
 from backend.models.game_session_model import GameSession, GameSessionUtils
 from backend.models.storyline import Storyline
@@ -20,17 +23,24 @@ from backend.models.message import Message
 from backend.utils.db_utils import DatabaseManager, get_db_manager
 from backend.utils.game_session_manager import (
     generate_session_id,
+    invalidate_user_session_index,
     validate_services_and_session,
 )
 from backend.utils.llm_utils import get_llm_utility
-from backend.utils.log_utils import write_markdown_log
+from backend.utils.log_utils import is_debug_logging_enabled, write_markdown_log
 from backend.utils.prompts import PromptCreator
+from backend.utils.scenario_manager import get_cached_scenario
 from backend.utils.story_generator import (
     generate_streaming_response,
     prepare_game_context,
 )
 from backend.utils.visualization_utils import VisualizationManager
 
+logger = get_logger("game_logic")
+
+# Runs the independent writes issued while creating a new game
+_game_creation_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="game-create")
+
 
 def _run_background_operations(
     session: GameSession,
@@ -52,6 +62,7 @@ def _run_background_operations(
         # Save updated session to database
         if not db.update_game_session(updated_session):
             logger.warning("Failed to save updated game session")
+        invalidate_user_session_index(updated_session.user_id)
 
         # Generate visual prompts
         VisualizationManager.generate_visual_prompts_for_session(session_id, complete_response)
@@ -79,7 +90,6 @@ def _run_background_operations(
 
 def create_new_game(user_id: str, scenario_id: str) -> Optional[str]:
     """Create a new game session backed by MongoDB."""
-    logger = get_logger("game_logic")
     start_time = time.time()
 
     logger.info("Creating new game for user: %s, scenario: %s", user_id, scenario_id)
@@ -91,7 +101,7 @@ def create_new_game(user_id: str, scenario_id: str) -> Optional[str]:
             logger.error("Database connection failed during game creation")
             return None
 
-        scenario = db.get_scenario(scenario_id)
+        scenario = get_cached_scenario(scenario_id)
         if not scenario:
             logger.error("Scenario not found: %s", scenario_id)
             return None
@@ -102,24 +112,32 @@ def create_new_game(user_id: str, scenario_id: str) -> Optional[str]:
         logger.info("Using scenario '%s' for new game", scenario_name)
 
         session_game_id = generate_session_id()
-        session_data = GameSessionUtils.create_new_session(user_id, scenario_id, session_game_id, storyline)
-        description = scenario.description
         initial_location = scenario.initial_location
-        session_data.update_world_state(
-            f"Game initialized. {description} The adventure begins in {initial_location}."
+        session_data = GameSessionUtils.create_new_session(
+            user_id,
+            scenario_id,
+            session_game_id,
+            storyline,
+            world_state=f"Game initialized. {scenario.description} The adventure begins in {initial_location}.",
+            last_scene=f"The adventure begins in {initial_location}.",
         )
-        session_data.update_last_scene(f"The adventure begins in {initial_location}.")
 
         logger.debug("Generated session data with game_session_id: %s", session_game_id)
 
-        session_id = db.create_game_session(session_data)
-        if not session_id:
+        # Allocate the session id up front so the chat document can be written in parallel
+        session_id = str(ObjectId())
+        chat_future = _game_creation_executor.submit(db.create_chat_document, session_id)
+
+        if not db.create_game_session(session_data, session_id=session_id):
             logger.error("Failed to create game session for user: %s", user_id)
+            # Don't leave the chat document behind for a session that was never written
+            if chat_future.result():
+                db.delete_chat(session_id)
             return None
 
         logger.info("Game session created in database: %s", session_id)
 
-        if not db.create_chat_document(session_id):
+        if not chat_future.result():
             logger.error("Failed to create chat document for session: %s", session_id)
             return None
 
@@ -166,7 +184,6 @@ def create_new_game(user_id: str, scenario_id: str) -> Optional[str]:
 
 def generate_initial_story_message(session_id: str) -> Generator[str, None, None]:
     """Stream the opening narrative for a newly created session."""
-    logger = get_logger("game_logic")
     start_time = time.time()
 
     logger.info("Generating initial story message for session: %s", session_id)
@@ -204,7 +221,7 @@ def generate_initial_story_message(session_id: str) -> Generator[str, None, None
         chunk_count = 0
         try:
             logger.info("Starting initial story generation for session: %s", session_id)
-            scenario = db.get_scenario(scenario_id)
+            scenario = get_cached_scenario(scenario_id)
             scenario_player_name = scenario.player_name if scenario else None
             character_candidates = list(session.character_summaries.keys()) if session.character_summaries else []
             if scenario_player_name:
@@ -308,9 +325,11 @@ def generate_initial_story_message(session_id: str) -> Generator[str, None, None
         yield f"Unexpected error: {exc}"
 
 
-def load_game_session(session_id: str) -> Dict[str, Any]:
-    """Load a game session and its chat history."""
-    logger = get_logger("game_logic")
+def load_game_session(session_id: str, message_limit: Optional[int] = None) -> Dict[str, Any]:
+    """Load a game session and its chat history.
+
+    With ``message_limit`` only the newest messages are returned.
+    """
     start_time = time.time()
 
     logger.info("Loading game session: %s", session_id)
@@ -331,7 +350,7 @@ def load_game_session(session_id: str) -> Dict[str, Any]:
         scenario_id = session.scenario_id
         logger.debug("Session found - user: %s, scenario: %s", user_id, scenario_id)
 
-        messages = db.get_chat_messages(session_id)
+        messages = db.get_chat_messages(session_id, limit=message_limit)
         logger.debug("Retrieved %s messages for session: %s", len(messages), session_id)
 
         duration = time.time() - start_time
@@ -369,7 +388,6 @@ def update_game_session(
     complete_response: str,
 ) -> GameSession:
     """Update game session with new player input and AI response."""
-    logger = get_logger("game_logic")
     start_time = time.time()
 
     user_id = session.user_id
@@ -530,7 +548,6 @@ def process_player_input(
     ws_notifier: Optional[Any] = None,
 ) -> Generator[str, None, None]:
     """Process player input and stream the StoryOS response."""
-    logger = get_logger("game_logic")
     start_time = time.time()
 
     input_length = len(player_input)
@@ -644,16 +661,18 @@ def process_player_input(
             )
 
             # Log the complete response to markdown file if debug logging is enabled
-            log_content = f"# Story Response\n\n"
-            log_content += f"**Session ID:** {session_id}\n"
-            log_content += f"**User ID:** {user_id}\n"
-            log_content += f"**Timestamp:** {datetime.utcnow().isoformat()}\n"
-            log_content += f"**Response Length:** {response_length} characters\n"
-            log_content += f"**Chunks:** {chunk_count}\n\n"
-            log_content += f"## Player Input\n\n{player_input}\n\n"
-            log_content += f"## DM Response\n\n{complete_response}\n"
-
-            write_markdown_log(log_content, prefix=f"story_response_{session_id}")
+            if is_debug_logging_enabled():
+                log_content = (
+                    f"# Story Response\n\n"
+                    f"**Session ID:** {session_id}\n"
+                    f"**User ID:** {user_id}\n"
+                    f"**Timestamp:** {datetime.utcnow().isoformat()}\n"
+                    f"**Response Length:** {response_length} characters\n"
+                    f"**Chunks:** {chunk_count}\n\n"
+                    f"## Player Input\n\n{player_input}\n\n"
+                    f"## DM Response\n\n{complete_response}\n"
+                )
+                write_markdown_log(log_content, prefix=f"story_response_{session_id}")
 
             # Increment turn count for this player action
             session.increment_turn_count()
@@ -3,12 +3,14 @@ Centralized logging configuration for StoryOS v2
 Provides comprehensive logging with different levels and formatters
 """
 
+import atexit
 import logging
 import os
+import queue
 import sys
 from datetime import datetime
-from typing import Optional
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from typing import List, Optional
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
 
 class ColoredFormatter(logging.Formatter):
     """Custom formatter with colors for console output"""
@@ -36,6 +38,8 @@ class StoryOSLogger:
     
     _loggers = {}
     _configured = False
+    _queue_listener: Optional[QueueListener] = None
+    _atexit_registered = False
     
     @classmethod
     def setup_logging(cls, log_level: str = "INFO", log_to_file: bool = True, 
@@ -69,6 +73,8 @@ class StoryOSLogger:
         # Clear existing handlers
         for handler in root_logger.handlers[:]:
             root_logger.removeHandler(handler)
+
+        handlers: List[logging.Handler] = []
         
         # Console handler with colors
         console_handler = logging.StreamHandler(sys.stdout)
@@ -78,7 +84,7 @@ class StoryOSLogger:
             datefmt='%Y-%m-%d %H:%M:%S'
         )
         console_handler.setFormatter(console_formatter)
-        root_logger.addHandler(console_handler)
+        handlers.append(console_handler)
         
         # File handler (if enabled) with rotation
         if log_to_file:
@@ -112,7 +118,7 @@ class StoryOSLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             file_handler.setFormatter(file_formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
         
         # Error file handler with rotation (always log errors to separate file)
         if log_to_file:
@@ -134,7 +140,20 @@ class StoryOSLogger:
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             error_handler.setFormatter(error_formatter)
-            root_logger.addHandler(error_handler)
+            handlers.append(error_handler)
+
+        # Logging threads only enqueue records; a single listener thread does the
+        # console and file I/O so request handlers never block on it. A listener
+        # from an earlier setup is stopped first so its thread and handlers don't
+        # keep writing alongside the new one.
+        cls._stop_queue_listener()
+        log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+        root_logger.addHandler(QueueHandler(log_queue))
+        cls._queue_listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        cls._queue_listener.start()
+        if not cls._atexit_registered:
+            atexit.register(cls._stop_queue_listener)
+            cls._atexit_registered = True
         
         # Set third-party loggers to WARNING to reduce noise
         logging.getLogger('pymongo').setLevel(logging.WARNING)
@@ -154,6 +173,17 @@ class StoryOSLogger:
         else:
             logger.info("Console only logging")
     
+    @classmethod
+    def _stop_queue_listener(cls) -> None:
+        """Flush and stop the current queue listener, closing its handlers"""
+        listener = cls._queue_listener
+        if listener is None:
+            return
+        cls._queue_listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
     @classmethod
     def get_logger(cls, name: str) -> logging.Logger:
         """Get a logger instance for a specific module"""
@@ -169,6 +199,8 @@ class StoryOSLogger:
     def log_user_action(cls, user_id: str, action: str, details: Optional[dict] = None):
         """Log user actions with consistent format"""
         logger = cls.get_logger("user_actions")
+        if not logger.isEnabledFor(logging.INFO):
+            return
         details_str = f" | Details: {details}" if details else ""
         logger.info(f"User: {user_id} | Action: {action}{details_str}")
     
@@ -183,6 +215,8 @@ class StoryOSLogger:
     def log_performance(cls, logger_name: str, operation: str, duration: float, details: Optional[dict] = None):
         """Log performance metrics"""
         logger = cls.get_logger(logger_name)
+        if not logger.isEnabledFor(logging.DEBUG):
+            return
         details_str = f" | Details: {details}" if details else ""
         logger.debug(f"Performance | Operation: {operation} | Duration: {duration:.3f}s{details_str}")
     
@@ -190,6 +224,8 @@ class StoryOSLogger:
     def log_api_call(cls, service: str, endpoint: str, status: str, duration: float, details: Optional[dict] = None):
         """Log API calls with consistent format"""
         logger = cls.get_logger("api_calls")
+        if not logger.isEnabledFor(logging.INFO):
+            return
         details_str = f" | Details: {details}" if details else ""
         logger.info(f"API Call | Service: {service} | Endpoint: {endpoint} | Status: {status} | Duration: {duration:.3f}s{details_str}")
 
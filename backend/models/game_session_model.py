@@ -4,11 +4,12 @@ Pydantic models for game session data validation and serialization
 """
 
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from pydantic import BaseModel, Field, validator
+from typing import Dict, List, Any, Optional, Set
+from pydantic import BaseModel, Field, PrivateAttr, validator
 from bson import ObjectId
 from backend.models.summary_update import SummaryUpdate
 from backend.models.storyline import Storyline
+from backend.utils.time_utils import utcnow
 
 
 class StoryEvent(BaseModel):
@@ -73,6 +74,9 @@ class GameSession(BaseModel):
     turn_count: int = Field(default=0, description="Number of story turns (player actions) completed")
     game_speed: int = Field(default=4, description="Story progression speed (1-10, higher = faster chapter advancement)")
     deleted: bool = Field(default=False, description="Whether the game session has been soft-deleted")
+
+    # Fields changed through the update helpers since the session was loaded or last saved
+    _dirty_fields: Set[str] = PrivateAttr(default_factory=set)
     
     @validator('created_at', 'last_updated', pre=True)
     def parse_datetime(cls, v):
@@ -107,9 +111,10 @@ class GameSession(BaseModel):
     @validator('user_id', 'scenario_id', 'world_state', 'last_scene')
     def validate_non_empty_strings(cls, v):
         """Ensure required string fields are not empty"""
-        if not v or not v.strip():
+        stripped = v.strip() if v else ""
+        if not stripped:
             raise ValueError("Field cannot be empty")
-        return v.strip()
+        return stripped
     
     class Config:
         # Allow field aliases (for MongoDB _id)
@@ -157,7 +162,7 @@ class GameSession(BaseModel):
     def add_story_event(self, title: str, description: str, event_time: Optional[datetime] = None) -> None:
         """Add a new story event to the timeline"""
         if event_time is None:
-            event_time = datetime.utcnow()
+            event_time = utcnow()
         
         event = StoryEvent(
             event_datetime=event_time,
@@ -168,42 +173,59 @@ class GameSession(BaseModel):
         self.timeline.append(event)
         # Keep timeline sorted
         self.timeline.sort(key=lambda x: x.event_datetime)
-        self.last_updated = datetime.utcnow()
+        self._touch('timeline')
     
     def update_character_summary(self, character_name: str, character_story: str) -> None:
         """Update or add a character summary"""
         self.character_summaries[character_name] = CharacterStory(character_story=character_story)
-        self.last_updated = datetime.utcnow()
+        self._touch('character_summaries')
     
     def update_world_state(self, new_state: str) -> None:
         """Update the world state"""
         self.world_state = new_state
-        self.last_updated = datetime.utcnow()
+        self._touch('world_state')
     
     def update_last_scene(self, new_scene: str) -> None:
         """Update the last scene"""
         self.last_scene = new_scene
-        self.last_updated = datetime.utcnow()
+        self._touch('last_scene')
 
     def update_current_location(self, new_location: str) -> None:
         """Update the current location"""
         self.current_location = new_location
-        self.last_updated = datetime.utcnow()
+        self._touch('current_location')
 
     def update_current_act(self, act_number: int) -> None:
         """Update the current act"""
         self.current_act = act_number
-        self.last_updated = datetime.utcnow()
+        self._touch('current_act')
 
     def update_current_chapter(self, chapter_number: int) -> None:
         """Update the current chapter"""
         self.current_chapter = chapter_number
-        self.last_updated = datetime.utcnow()
+        self._touch('current_chapter')
+
+    def _touch(self, *fields: str) -> None:
+        """Record changed fields and bump last_updated"""
+        self.last_updated = utcnow()
+        self._dirty_fields.update(fields)
+        self._dirty_fields.add('last_updated')
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database storage"""
-        data = self.dict(by_alias=True, exclude_unset=True)
-        
+        return self._to_storage_dict(self.dict(by_alias=True, exclude_unset=True))
+
+    def to_update_dict(self) -> Dict[str, Any]:
+        """Convert only the fields changed since the last save; empty when nothing is tracked"""
+        if not self._dirty_fields:
+            return {}
+        return self._to_storage_dict(self.dict(by_alias=True, include=set(self._dirty_fields)))
+
+    def clear_dirty_fields(self) -> None:
+        """Forget tracked changes once they have been saved"""
+        self._dirty_fields.clear()
+
+    def _to_storage_dict(self, data: Dict[str, Any]) -> Dict[str, Any]:
         # Convert datetime objects to ISO strings
         if 'created_at' in data:
             data['created_at'] = self.created_at.isoformat()
@@ -238,12 +260,12 @@ class GameSession(BaseModel):
         """Update the current act and chapter"""
         self.current_act = act_number
         self.current_chapter = chapter_number
-        self.last_updated = datetime.utcnow()
+        self._touch('current_act', 'current_chapter')
 
     def increment_turn_count(self) -> None:
         """Increment the turn count by 1"""
         self.turn_count += 1
-        self.last_updated = datetime.utcnow()
+        self._touch('turn_count')
 
     def update(self, summary_update: SummaryUpdate) -> None:
         self.add_story_event(summary_update.summarized_event.event_title, summary_update.summarized_event.event_summary)
@@ -292,9 +314,16 @@ class GameSessionUtils:
     """Utility functions for game session operations"""
     
     @staticmethod
-    def create_new_session(user_id: str, scenario_id: str, game_session_id: int, storyline: Storyline) -> GameSession:
+    def create_new_session(
+        user_id: str,
+        scenario_id: str,
+        game_session_id: int,
+        storyline: Storyline,
+        world_state: str = "Game session initialized",
+        last_scene: str = "Adventure is about to begin",
+    ) -> GameSession:
         """Create a new game session with default values"""
-        now = datetime.utcnow()
+        now = utcnow()
 
         return GameSession(
             created_at=now,
@@ -305,8 +334,8 @@ class GameSessionUtils:
             version=1,
             timeline=[],
             character_summaries={},
-            world_state="Game session initialized",
-            last_scene="Adventure is about to begin",
+            world_state=world_state,
+            last_scene=last_scene,
             current_location="Players bedroom",
             current_act=1,
             current_chapter=1,
@@ -342,7 +371,7 @@ class GameSessionUtils:
             session_data[key] = value
         
         # Ensure last_updated is set
-        session_data['last_updated'] = datetime.utcnow()
+        session_data['last_updated'] = utcnow()
         
         return GameSession.from_dict(session_data)
 
@@ -2,11 +2,12 @@
 
 from __future__ import annotations
 
-from datetime import datetime
 from typing import Any, Dict, List, Optional
 
 from pydantic import BaseModel, Field
 
+from backend.utils.time_utils import utcnow
+
 
 class Message(BaseModel):
     """Represents a chat message used across StoryOS services."""
@@ -44,7 +45,7 @@ class Message(BaseModel):
             sender=sender,
             content=content,
             role=role,
-            timestamp=datetime.utcnow().isoformat(),
+            timestamp=utcnow().isoformat(),
             message_id=message_id,
             full_prompt=full_prompt or [],
             visual_prompts=visual_prompts or {},
@@ -57,9 +57,10 @@ class SummarizedEvent(BaseModel):
     @classmethod
     def validate_non_empty_string(cls, v: str) -> str:
         """Ensure strings are not empty."""
-        if not v or not v.strip():
+        stripped = v.strip() if v else ""
+        if not stripped:
             raise ValueError('String cannot be empty')
-        return v.strip()
+        return stripped
 
 
 class SummaryUpdate(BaseModel):
@@ -1,8 +1,10 @@
 """Authentication service bridging data access and JWT handling."""
 from __future__ import annotations
 
+import threading
+import time
 from datetime import datetime, timedelta, timezone
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Optional, Tuple
 
 import jwt
 from fastapi import HTTPException, status
@@ -12,6 +14,12 @@ from backend.logging_config import get_logger
 from backend.utils.auth import hash_password, verify_password
 from backend.utils.db_utils import DatabaseManager, get_db_manager
 
+# How long a user's role is reused when resolving tokens before it is re-read from MongoDB.
+ROLE_CACHE_TTL_SECONDS = 30.0
+
+# Privileged roles are re-read on every request so a demotion applies immediately on every worker
+UNCACHED_ROLES = frozenset({"admin"})
+
 
 class AuthService:
     """Small facade for user authentication and token management."""
@@ -25,6 +33,9 @@ class AuthService:
         self.settings = settings
         self.db_manager = db_manager or get_db_manager()
         self.logger = get_logger("auth_service")
+        # Every authenticated request resolves its user; cache the role lookup by user_id
+        self._role_cache: Dict[str, Tuple[float, str]] = {}
+        self._role_cache_lock = threading.Lock()
 
     # ------------------------------------------------------------------
     # User authentication helpers
@@ -104,7 +115,13 @@ class AuthService:
         return payload
 
     def resolve_user_from_token(self, token: str) -> Dict[str, Any]:
-        """Decode a token and ensure the backing user still exists."""
+        """Decode a token and ensure the backing user still exists.
+
+        Non-privileged roles are cached per process for ``ROLE_CACHE_TTL_SECONDS``.
+        Only this worker's entry is dropped by ``invalidate_user_role``, so on other
+        workers a role change or deleted user can take up to the TTL to apply.
+        Admin roles are never cached.
+        """
         payload = self.decode_token(token)
         user_id = payload.get("sub")
         role = payload.get("role")
@@ -114,7 +131,14 @@ class AuthService:
                 detail="Invalid authentication payload",
             )
 
-        user = self.db_manager.get_user(user_id)
+        now = time.monotonic()
+        with self._role_cache_lock:
+            cached = self._role_cache.get(user_id)
+        if cached and now - cached[0] < ROLE_CACHE_TTL_SECONDS:
+            return {"user_id": user_id, "role": cached[1]}
+
+        # Only the role is needed here; skip the password hash and profile fields
+        user = self.db_manager.get_user(user_id, fields={"role": 1})
         if not user:
             self.logger.info("Token references missing user %s", user_id)
             raise HTTPException(
@@ -122,7 +146,16 @@ class AuthService:
                 detail="User no longer exists",
             )
 
-        return {"user_id": user_id, "role": user.get("role", role)}
+        stored_role = user.get("role", role)
+        if stored_role not in UNCACHED_ROLES:
+            with self._role_cache_lock:
+                self._role_cache[user_id] = (now, stored_role)
+        return {"user_id": user_id, "role": stored_role}
+
+    def invalidate_user_role(self, user_id: str) -> None:
+        """Drop the cached role so the next request re-reads it from the database."""
+        with self._role_cache_lock:
+            self._role_cache.pop(user_id, None)
 
 
 __all__ = ["AuthService"]
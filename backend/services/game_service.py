@@ -3,14 +3,21 @@ from __future__ import annotations
 
 import asyncio
 from functools import partial
-from typing import Any, AsyncGenerator, Dict, Generator, Optional, cast
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Tuple, cast
 
 from backend.core import game_logic
 from backend.logging_config import get_logger
 from backend.utils.db_utils import DatabaseManager, get_db_manager
-from backend.utils.game_session_manager import get_user_game_sessions
+from backend.utils.game_session_manager import (
+    SessionSummary,
+    get_user_session_index,
+    invalidate_user_session_index,
+    validate_game_session,
+)
 from backend.utils.llm_utils import LLMUtility, get_llm_utility
 
+SESSION_PAGE_SIZE = 10
+
 
 class GameService:
     """Facade over the legacy game logic that exposes async-friendly helpers."""
@@ -30,17 +37,37 @@ class GameService:
     async def create_game_session(self, user_id: str, scenario_id: str) -> Optional[str]:
         """Create a new game session for the user."""
         self.logger.debug("Creating game session for user=%s scenario=%s", user_id, scenario_id)
-        return await asyncio.to_thread(game_logic.create_new_game, user_id, scenario_id)
-
-    async def list_user_sessions(self, user_id: str) -> list[Dict[str, Any]]:
-        """Return all sessions owned by a user."""
-        self.logger.debug("Listing sessions for user=%s", user_id)
-        return await asyncio.to_thread(get_user_game_sessions, user_id)
+        session_id = await asyncio.to_thread(game_logic.create_new_game, user_id, scenario_id)
+        if session_id:
+            invalidate_user_session_index(user_id)
+        return session_id
 
-    async def load_session(self, session_id: str) -> Dict[str, Any]:
-        """Load session metadata and message history."""
+    async def list_user_sessions(
+        self,
+        user_id: str,
+        *,
+        page: Optional[int] = None,
+        page_size: int = SESSION_PAGE_SIZE,
+    ) -> Tuple[list[SessionSummary], int]:
+        """Return a user's sessions, most recently updated first, and the total count.
+
+        When ``page`` is given only that 1-based page of ``page_size`` sessions is returned.
+        """
+        self.logger.debug("Listing sessions for user=%s page=%s", user_id, page)
+        index = await asyncio.to_thread(get_user_session_index, user_id)
+        if page is None:
+            return list(index.sessions), index.count
+        start = (page - 1) * page_size
+        return list(index.sessions[start:start + page_size]), index.count
+
+    async def user_owns_session(self, user_id: str, session_id: str) -> bool:
+        """Check session ownership without loading the session or its chat history."""
+        return await asyncio.to_thread(validate_game_session, user_id, session_id)
+
+    async def load_session(self, session_id: str, message_limit: Optional[int] = None) -> Dict[str, Any]:
+        """Load session metadata and message history, optionally just the newest messages."""
         self.logger.debug("Loading session=%s", session_id)
-        return await asyncio.to_thread(game_logic.load_game_session, session_id)
+        return await asyncio.to_thread(game_logic.load_game_session, session_id, message_limit)
 
     async def stream_initial_story(self, session_id: str) -> AsyncGenerator[str, None]:
         """Async wrapper around the synchronous generator that yields initial story chunks."""
@@ -0,0 +1,28 @@
+import os
+from unittest.mock import create_autospec
+
+import pytest
+
+# Logging is configured when backend.logging_config is first imported; keep test
+# runs on the console instead of writing into the repository's logs/ directory.
+os.environ.setdefault("STORYOS_LOG_TO_FILE", "false")
+
+from backend.utils.db_utils import DatabaseManager  # noqa: E402
+
+
+@pytest.fixture
+def fake_db(monkeypatch):
+    """Build a connected DatabaseManager double and route get_db_manager() in the given modules to it.
+
+    The double is autospecced, so tests configure only the methods they exercise
+    (``db.get_scenario.side_effect = ...``) and assert on the recorded calls.
+    """
+
+    def install(*modules):
+        db = create_autospec(DatabaseManager, instance=True)
+        db.is_connected.return_value = True
+        for module in modules:
+            monkeypatch.setattr(module, "get_db_manager", lambda: db)
+        return db
+
+    return install
@@ -0,0 +1,63 @@
+from types import SimpleNamespace
+
+import pytest
+from fastapi import HTTPException
+
+from backend.config.settings import Settings
+from backend.services.auth_service import AuthService
+
+
+@pytest.fixture
+def auth(fake_db):
+    """An AuthService whose database serves ``auth.users``, keyed by user_id"""
+    users = {}
+    db = fake_db()
+    db.get_user.side_effect = lambda user_id, fields=None: users.get(user_id)
+    return SimpleNamespace(users=users, db=db, service=AuthService(settings=Settings(), db_manager=db))
+
+
+def test_role_lookup_is_cached_until_invalidated(auth):
+    users, service, db = auth.users, auth.service, auth.db
+    users["alice"] = {"role": "user"}
+    token = service.create_access_token("alice", "user")
+
+    assert service.resolve_user_from_token(token) == {"user_id": "alice", "role": "user"}
+    users["alice"]["role"] = "admin"
+    assert service.resolve_user_from_token(token)["role"] == "user"
+    assert db.get_user.call_count == 1
+
+    service.invalidate_user_role("alice")
+    assert service.resolve_user_from_token(token)["role"] == "admin"
+    assert db.get_user.call_count == 2
+
+
+def test_missing_user_is_not_cached(auth):
+    service, db = auth.service, auth.db
+    token = service.create_access_token("ghost", "user")
+
+    for _ in range(2):
+        with pytest.raises(HTTPException):
+            service.resolve_user_from_token(token)
+    assert [args[0] for args, _kwargs in db.get_user.call_args_list] == ["ghost", "ghost"]
+
+
+def test_auth_service_dependency_is_per_settings_and_db(fake_db):
+    from backend.api.dependencies import get_auth_service
+
+    settings = Settings()
+    first_db, second_db = fake_db(), fake_db()
+
+    service = get_auth_service(settings=settings, db_manager=first_db)
+    assert get_auth_service(settings=settings, db_manager=first_db) is service
+    assert get_auth_service(settings=settings, db_manager=second_db).db_manager is second_db
+
+
+def test_admin_role_is_always_reread(auth):
+    users, service, db = auth.users, auth.service, auth.db
+    users["root"] = {"role": "admin"}
+    token = service.create_access_token("root", "admin")
+
+    assert service.resolve_user_from_token(token)["role"] == "admin"
+    users["root"]["role"] = "user"
+    assert service.resolve_user_from_token(token)["role"] == "user"
+    assert db.get_user.call_count == 2
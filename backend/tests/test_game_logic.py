@@ -0,0 +1,32 @@
+import pytest
+
+from backend.core import game_logic
+from backend.models.scenario import Scenario
+
+
+@pytest.fixture
+def game_db(fake_db, monkeypatch):
+    db = fake_db(game_logic)
+    scenario = Scenario(**Scenario.model_config["json_schema_extra"]["example"])
+    monkeypatch.setattr(game_logic, "get_cached_scenario", lambda _scenario_id: scenario)
+    db.create_game_session.side_effect = lambda session_data, session_id=None: session_id
+    db.create_chat_document.return_value = True
+    return db
+
+
+def test_create_new_game_writes_session_and_chat_under_one_id(game_db):
+    session_id = game_logic.create_new_game("user123", "Awakening Echoes of Code")
+
+    assert session_id is not None
+    assert game_db.create_game_session.call_count == 1
+    assert game_db.create_game_session.call_args.kwargs["session_id"] == session_id
+    game_db.create_chat_document.assert_called_once_with(session_id)
+
+
+def test_create_new_game_removes_chat_when_session_write_fails(game_db):
+    game_db.create_game_session.side_effect = None
+    game_db.create_game_session.return_value = None
+
+    assert game_logic.create_new_game("user123", "Awakening Echoes of Code") is None
+    chat_id = game_db.create_chat_document.call_args.args[0]
+    game_db.delete_chat.assert_called_once_with(chat_id)
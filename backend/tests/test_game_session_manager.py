@@ -0,0 +1,124 @@
+from unittest.mock import Mock
+
+import pytest
+from bson import ObjectId
+
+from backend.utils import game_session_manager
+from backend.utils.game_session_manager import (
+    SessionSummary,
+    UserSessionIndex,
+    get_user_session_index,
+    invalidate_user_session_index,
+)
+
+
+def _sessions():
+    # Ordered most recent first, as returned by the database query.
+    return [
+        {"_id": "b", "last_updated": "2025-01-17T10:00:00"},
+        {"_id": "c", "last_updated": "2025-01-16T10:00:00"},
+        {"_id": "a", "last_updated": "2025-01-15T10:00:00"},
+    ]
+
+
+@pytest.fixture
+def fetch_sessions(monkeypatch):
+    """Serve _sessions() in place of the database listing, starting from an empty index"""
+    fetch = Mock(side_effect=lambda _user_id, **_kwargs: _sessions())
+    monkeypatch.setattr(game_session_manager, "get_user_game_sessions", fetch)
+    invalidate_user_session_index("user123")
+    return fetch
+
+
+@pytest.fixture
+def ownership_db(fake_db):
+    """Database double that owns no sessions unless a test adds them"""
+    db = fake_db(game_session_manager)
+    db.owned = set()
+    db.user_owns_game_session.side_effect = lambda _user_id, session_id: session_id in db.owned
+    return db
+
+
+def _lookups(db):
+    return [args[1] for args, _kwargs in db.user_owns_game_session.call_args_list]
+
+
+def test_session_index_keeps_database_order():
+    index = UserSessionIndex.from_sessions(_sessions())
+
+    assert [session.id for session in index.sessions] == ["b", "c", "a"]
+    assert index.count == 3
+    assert index.most_recent.id == "b"
+    assert index.ids == frozenset({"a", "b", "c"})
+
+
+def test_session_index_empty():
+    index = UserSessionIndex.from_sessions([])
+
+    assert index.count == 0
+    assert index.most_recent is None
+    assert "a" not in index.ids
+
+
+def test_session_index_is_cached_until_invalidated(fetch_sessions):
+    first = get_user_session_index("user123")
+    second = get_user_session_index("user123")
+    assert first is second
+    assert fetch_sessions.call_count == 1
+
+    invalidate_user_session_index("user123")
+    get_user_session_index("user123")
+    assert fetch_sessions.call_count == 2
+
+
+def test_session_summary_to_dict_keeps_latest_event():
+    event = {"event_title": "Entered the Tavern"}
+    summary = SessionSummary.from_document(
+        {"_id": "a", "scenario_id": "s1", "user_id": "user123", "timeline": [event], "timeline_count": 7}
+    )
+
+    payload = summary.to_dict()
+    assert payload["_id"] == "a"
+    assert payload["timeline"] == [event]
+    assert payload["timeline_count"] == 7
+    assert payload["name"] is None
+
+
+def test_validate_game_session_uses_id_set(fetch_sessions, ownership_db):
+    assert game_session_manager.validate_game_session("user123", "b")
+    ownership_db.user_owns_game_session.assert_not_called()
+
+
+def test_validate_game_session_miss_keeps_index(fetch_sessions, ownership_db):
+    assert not game_session_manager.validate_game_session("user123", "zzz")
+    assert not game_session_manager.validate_game_session("user123", "zzz")
+    assert fetch_sessions.call_count == 1
+    assert _lookups(ownership_db) == ["zzz", "zzz"]
+
+
+def test_validate_game_session_hit_on_miss_drops_index(fetch_sessions, ownership_db):
+    fetch_sessions.side_effect = [_sessions()[:2], _sessions()]
+    ownership_db.owned.add("a")
+
+    get_user_session_index("user123")
+    assert game_session_manager.validate_game_session("user123", "a")
+    assert "a" in get_user_session_index("user123").ids
+
+
+def test_session_index_stringifies_ids_once():
+    oid = ObjectId()
+    index = UserSessionIndex.from_sessions([{"_id": oid, "last_updated": "2025-01-15T10:00:00"}])
+
+    assert index.sessions[0].id == str(oid)
+    assert str(oid) in index.ids
+
+
+def test_remove_from_user_session_index_keeps_other_sessions(fetch_sessions):
+    get_user_session_index("user123")
+
+    game_session_manager.remove_from_user_session_index("user123", "c")
+
+    index = get_user_session_index("user123")
+    assert [session.id for session in index.sessions] == ["b", "a"]
+    assert "c" not in index.ids
+    assert fetch_sessions.call_count == 1
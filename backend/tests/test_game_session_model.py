@@ -0,0 +1,39 @@
+from backend.models.game_session_model import GameSessionUtils
+from backend.models.storyline import Storyline
+
+
+def _session():
+    storyline = Storyline(archetype="Quest", storyline_summary="A short quest", protagonist_name="Ada", acts=[])
+    return GameSessionUtils.create_new_session("user123", "s1", 1, storyline)
+
+
+def test_to_update_dict_only_includes_changed_fields():
+    session = _session()
+    assert session.to_update_dict() == {}
+
+    session.update_world_state("Storm over the harbour")
+    session.increment_turn_count()
+
+    update = session.to_update_dict()
+    assert set(update) == {"world_state", "turn_count", "last_updated"}
+    assert update["world_state"] == "Storm over the harbour"
+    assert isinstance(update["last_updated"], str)
+
+
+def test_to_update_dict_serializes_like_to_dict():
+    session = _session()
+    session.add_story_event("Arrived", "Ada reached the harbour")
+    session.update_character_summary("Ada", "A sailor")
+
+    update = session.to_update_dict()
+    full = session.to_dict()
+    assert update["timeline"] == full["timeline"]
+    assert update["character_summaries"] == full["character_summaries"]
+
+
+def test_clear_dirty_fields_after_save():
+    session = _session()
+    session.update_last_scene("The docks")
+    session.clear_dirty_fields()
+
+    assert session.to_update_dict() == {}
@@ -0,0 +1,39 @@
+from unittest.mock import MagicMock
+
+import pytest
+
+from backend.utils import initialize_db
+
+
+@pytest.fixture
+def initialized_db(fake_db):
+    """Database double with every prompt and scenario present and only the current indexes"""
+    db = fake_db()
+    db.get_active_system_prompt.return_value = {"name": "default"}
+    db.get_scenario_count.return_value = 1
+    db.get_active_visualization_system_prompt.return_value = "Describe the scene."
+    db.index_names = {
+        "users": ["_id_", "user_id_1"],
+        "scenarios": ["_id_", "scenario_id_1"],
+        "active_game_sessions": ["_id_", "user_id_1_last_updated_-1"],
+        "chats": ["_id_", "game_session_id_1"],
+        "system_prompts": ["_id_", "active_1_name_1"],
+    }
+    db.db = MagicMock()
+    db.db.list_collection_names.side_effect = lambda: list(db.index_names)
+    db.db.__getitem__.side_effect = lambda name: MagicMock(
+        list_indexes=lambda: [{"name": index_name} for index_name in db.index_names[name]]
+    )
+    return db
+
+
+def test_check_skips_indexes_when_all_present(initialized_db):
+    status = initialize_db._check_initialization_status(initialized_db)
+    assert status["indexes_needed"] is False
+    assert status["any_needed"] is False
+
+
+def test_check_flags_superseded_index_for_migration(initialized_db):
+    initialized_db.index_names["active_game_sessions"].append("user_id_1_created_at_-1")
+    status = initialize_db._check_initialization_status(initialized_db)
+    assert status["indexes_needed"] is True
@@ -0,0 +1,13 @@
+from backend.logging_config import StoryOSLogger
+
+
+def test_setup_logging_again_replaces_queue_listener(monkeypatch):
+    previous = StoryOSLogger._queue_listener
+    monkeypatch.setattr(StoryOSLogger, "_configured", False)
+
+    StoryOSLogger.setup_logging(log_to_file=False)
+
+    current = StoryOSLogger._queue_listener
+    assert current is not None and current is not previous
+    if previous is not None:
+        assert previous._thread is None
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+
+import pytest
+
+from backend.models.scenario import Scenario
+from backend.utils import scenario_manager
+from backend.utils.scenario_manager import get_visible_scenarios, invalidate_scenario_cache
+
+
+def _scenario(scenario_id):
+    example = dict(Scenario.model_config["json_schema_extra"]["example"])
+    return Scenario(**{**example, "scenario_id": scenario_id})
+
+
+def _ids(scenarios):
+    return [scenario.scenario_id for scenario in scenarios]
+
+
+@pytest.fixture
+def scenario_db(fake_db):
+    db = fake_db(scenario_manager)
+    db.get_scenario.side_effect = _scenario
+    db.get_all_scenarios.side_effect = lambda user_id=None: [_scenario(f"scenario-for-{user_id}")]
+    invalidate_scenario_cache()
+    return db
+
+
+def _scopes(db):
+    return [kwargs["user_id"] for _args, kwargs in db.get_all_scenarios.call_args_list]
+
+
+def test_scenario_list_is_cached_per_scope_until_invalidated(scenario_db):
+
+    assert _ids(get_visible_scenarios("user123")) == ["scenario-for-user123"]
+    assert _ids(get_visible_scenarios("user123")) == ["scenario-for-user123"]
+    assert _ids(get_visible_scenarios(None)) == ["scenario-for-None"]
+    assert _scopes(scenario_db) == ["user123", None]
+
+    invalidate_scenario_cache()
+    get_visible_scenarios("user123")
+    assert _scopes(scenario_db) == ["user123", None, "user123"]
+
+
+def test_private_scenario_invalidation_keeps_other_users_cached(scenario_db):
+    for scope in ("alice", "bob", None):
+        get_visible_scenarios(scope)
+
+    invalidate_scenario_cache(SimpleNamespace(scenario_id="alice-only", visibility="private", author="alice"))
+    for scope in ("alice", "bob", None):
+        get_visible_scenarios(scope)
+
+    assert _scopes(scenario_db) == ["alice", "bob", None, "alice", None]
+
+
+def test_scenario_summaries_are_projected_and_cached_separately(scenario_db):
+    scenario_db.get_scenario_summaries.return_value = [
+        {"scenario_id": "echoes", "name": "Echoes", "description": "", "author": "lojo",
+         "visibility": "public", "version": 1},
+        {"scenario_id": "broken", "name": "Missing author"},
+    ]
+
+    summaries = scenario_manager.get_visible_scenario_summaries("lojo")
+    scenario_manager.get_visible_scenario_summaries("lojo")
+
+    assert [summary["scenario_id"] for summary in summaries] == ["echoes"]
+    scenario_db.get_scenario_summaries.assert_called_once_with(
+        list(scenario_manager.SCENARIO_SUMMARY_FIELDS), user_id="lojo"
+    )
+    scenario_db.get_all_scenarios.assert_not_called()
+
+    invalidate_scenario_cache()
+    scenario_manager.get_visible_scenario_summaries("lojo")
+    assert scenario_db.get_scenario_summaries.call_count == 2
+
+
+def test_single_scenario_is_cached_until_invalidated(scenario_db):
+
+    first = scenario_manager.get_cached_scenario("echoes")
+    assert scenario_manager.get_cached_scenario("echoes") is first
+    scenario_db.get_scenario.assert_called_once_with("echoes")
+
+    invalidate_scenario_cache(first)
+    scenario_manager.get_cached_scenario("echoes")
+    assert scenario_db.get_scenario.call_count == 2
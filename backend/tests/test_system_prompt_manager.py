@@ -0,0 +1,25 @@
+from backend.utils import system_prompt_manager
+from backend.utils.system_prompt_manager import (
+    get_active_system_prompt,
+    get_active_visualization_system_prompt,
+    invalidate_system_prompt_cache,
+)
+
+
+def test_system_prompts_are_cached_until_invalidated(fake_db):
+    db = fake_db(system_prompt_manager)
+    db.get_active_system_prompt.side_effect = lambda: {"_id": "prompt-1", "content": "You are the narrator."}
+    db.get_active_visualization_system_prompt.return_value = "Describe the scene."
+    invalidate_system_prompt_cache()
+
+    first = get_active_system_prompt()
+    first["content"] = "changed by caller"
+    assert get_active_system_prompt()["content"] == "You are the narrator."
+    assert get_active_visualization_system_prompt() == "Describe the scene."
+    assert get_active_visualization_system_prompt() == "Describe the scene."
+    assert db.get_active_system_prompt.call_count == 1
+    assert db.get_active_visualization_system_prompt.call_count == 1
+
+    invalidate_system_prompt_cache()
+    get_active_system_prompt()
+    assert db.get_active_system_prompt.call_count == 2
@@ -0,0 +1,51 @@
+import asyncio
+
+from backend.api.routers import websocket
+
+
+async def _chunks(*parts):
+    for part in parts:
+        yield part
+
+
+def _collect(chunks):
+    async def _run():
+        return [chunk async for chunk in websocket._coalesce_chunks(chunks)]
+
+    return asyncio.run(_run())
+
+
+def test_coalesce_chunks_merges_small_pieces(monkeypatch):
+    monkeypatch.setattr(websocket, "STORY_CHUNK_FLUSH_CHARS", 6)
+    monkeypatch.setattr(websocket, "STORY_CHUNK_FLUSH_SECONDS", 60.0)
+
+    frames = _collect(_chunks("Onc", "e u", "pon", " a", " time"))
+
+    assert frames == ["Once u", "pon a time"]
+    assert "".join(frames) == "Once upon a time"
+
+
+def test_coalesce_chunks_flushes_remainder():
+    assert _collect(_chunks("Hi")) == ["Hi"]
+    assert _collect(_chunks()) == []
+
+
+def test_coalesce_chunks_flushes_when_source_stalls(monkeypatch):
+    monkeypatch.setattr(websocket, "STORY_CHUNK_FLUSH_SECONDS", 0.01)
+    stall_over = None
+
+    async def _stalling():
+        yield "The end."
+        await stall_over.wait()
+        yield " Status"
+
+    async def _run():
+        nonlocal stall_over
+        stall_over = asyncio.Event()
+        frames = websocket._coalesce_chunks(_stalling())
+        first = await asyncio.wait_for(frames.__anext__(), timeout=1.0)
+        assert not stall_over.is_set()
+        stall_over.set()
+        return [first] + [chunk async for chunk in frames]
+
+    assert asyncio.run(_run()) == ["The end.", " Status"]
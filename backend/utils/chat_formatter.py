@@ -2,18 +2,15 @@
 
 from __future__ import annotations
 
-import hashlib
-import threading
-import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
 
 from backend.utils.streamlit_shim import st
 
 from backend.logging_config import StoryOSLogger, get_logger
 from backend.models.message import Message
-from backend.utils.st_session_management import SessionManager
-from backend.utils.visualization_utils import VisualizationManager
+
+logger = get_logger("chat_formatter")
 
 
 def format_chat_message(
@@ -21,16 +18,10 @@ def format_chat_message(
     session_id: str,
 ) -> None:
     """Render a chat message within Streamlit."""
-    logger = get_logger("chat_formatter")
+    # Imported here so format_timestamp callers don't load the image/LLM clients
+    from backend.utils.visualization_utils import VisualizationManager
 
     try:
-        if not isinstance(message, Message):  # Safeguard for legacy calls
-            if isinstance(message, dict):
-                message = Message.from_dict(message)
-            else:
-                serialized = getattr(message, "to_dict", lambda: message)()
-                message = Message.from_dict(serialized)
-
         sender = message.sender or "unknown"
         content = message.content or ""
         message_id = str(message.message_id)
@@ -113,19 +104,23 @@ def format_chat_message(
         st.error("Error displaying message")
 
 
+@lru_cache(maxsize=1024)
+def _format_iso_timestamp(timestamp_str: str) -> str:
+    dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
+    return dt.strftime("%Y-%m-%d %H:%M")
+
+
 def format_timestamp(timestamp_str: str) -> str:
     """Format an ISO timestamp string for display."""
-    logger = get_logger("chat_formatter")
-
     if not timestamp_str:
         logger.debug("Empty timestamp provided")
         return "Unknown"
 
     try:
-        dt = datetime.fromisoformat(timestamp_str.replace("Z", "+00:00"))
-        formatted = dt.strftime("%Y-%m-%d %H:%M")
+        # The same message and session timestamps are formatted on every render
+        formatted = _format_iso_timestamp(timestamp_str)
         logger.debug("Formatted timestamp: %s -> %s", timestamp_str, formatted)
         return formatted
-    except (ValueError, AttributeError) as exc:
+    except (ValueError, AttributeError, TypeError) as exc:
         logger.warning("Failed to parse timestamp %s: %s", timestamp_str, exc)
         return timestamp_str
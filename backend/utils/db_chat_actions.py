@@ -6,11 +6,12 @@ Handles CRUD operations for chat messages and visual prompts in MongoDB
 import json
 import time
 from backend.utils.streamlit_shim import st
-from datetime import datetime
 from typing import Dict, List, Optional, Any
 from pymongo.database import Database
 from pymongo.errors import WriteError
 from backend.logging_config import get_logger, StoryOSLogger
+from backend.utils.time_utils import utcnow
+from backend.utils.db_game_session_actions import session_object_id
 
 # Model imports
 from backend.models.message import Message
@@ -26,14 +27,6 @@ class DbChatActions:
         self.logger = get_logger("database.chat_actions")
         self.logger.debug("DbChatActions initialized")
 
-    @staticmethod
-    def find_message(messages: List[Message], message_id: str) -> Optional[Message]:
-        """Find a message by its message_id field from a list of Message objects"""
-        for msg in messages:
-            if msg.message_id == message_id:
-                return msg
-        return None
-
     def create_chat_document(self, game_session_id: str) -> bool:
         """Create a new chat document for a game session"""
         start_time = time.time()
@@ -44,11 +37,10 @@ class DbChatActions:
                 self.logger.error("Cannot create chat document - database not connected")
                 return False
                 
-            from bson import ObjectId
             chat_doc = {
-                'game_session_id': ObjectId(game_session_id),
+                'game_session_id': session_object_id(game_session_id),
                 'messages': [],
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': utcnow().isoformat()
             }
             
             result = self.db.chats.insert_one(chat_doc)
@@ -84,17 +76,21 @@ class DbChatActions:
         """Add a message to the chat"""
         start_time = time.time()
         content_length = len(content)
-        self.logger.debug(f"Adding chat message from {sender} to session {game_session_id} (length: {content_length})")
+        self.logger.debug("Adding chat message from %s to session %s (length: %s)", sender, game_session_id, content_length)
 
         try:
             if self.db is None:
                 self.logger.error("Cannot add chat message - database not connected")
                 return False
                 
-            from bson import ObjectId
-            chat_filter = {'game_session_id': ObjectId(game_session_id), 'deleted': {'$ne': True}}
-            chat_doc = self.db.chats.find_one(chat_filter, {'messages': 1})
-            message_idx = len(chat_doc.get('messages', [])) if chat_doc and isinstance(chat_doc.get('messages'), list) else 0
+            chat_filter = {'game_session_id': session_object_id(game_session_id), 'deleted': {'$ne': True}}
+            # The message id only needs the current message count, so count server-side
+            # instead of pulling the whole chat history
+            chat_doc = self.db.chats.find_one(
+                chat_filter,
+                {'message_count': {'$cond': [{'$isArray': '$messages'}, {'$size': '$messages'}, 0]}},
+            )
+            message_idx = chat_doc.get('message_count', 0) if chat_doc else 0
 
             message = Message.create_chat_message(
                 sender=sender,
@@ -112,7 +108,7 @@ class DbChatActions:
 
             # Ensure timestamps are always stored
             if not message_record.get('timestamp'):
-                message_record['timestamp'] = datetime.utcnow().isoformat()
+                message_record['timestamp'] = utcnow().isoformat()
 
             try:
                 result = self.db.chats.update_one(
@@ -124,7 +120,7 @@ class DbChatActions:
                 duration = time.time() - start_time
 
                 if success:
-                    self.logger.debug(f"Chat message added successfully from {sender} to session {game_session_id}")
+                    self.logger.debug("Chat message added successfully from %s to session %s", sender, game_session_id)
                     StoryOSLogger.log_performance("database", "add_chat_message", duration, {
                         "game_session_id": game_session_id,
                         "sender": sender,
@@ -146,7 +142,7 @@ class DbChatActions:
                         import os
                         os.makedirs('logs', exist_ok=True)
 
-                        timestamp = datetime.utcnow().strftime('%Y%m%d_%H%M%S')
+                        timestamp = utcnow().strftime('%Y%m%d_%H%M%S')
                         filename = f"logs/oversized_document_{game_session_id}_{timestamp}.json"
 
                         # Get the full chat document to see what's causing the size issue
@@ -201,18 +197,22 @@ class DbChatActions:
     def get_chat_messages(self, game_session_id: str, limit: Optional[int] = None) -> List[Message]:
         """Get chat messages for a game session"""
         start_time = time.time()
-        self.logger.debug(f"Retrieving chat messages for session: {game_session_id} (limit: {limit})")
+        self.logger.debug("Retrieving chat messages for session: %s (limit: %s)", game_session_id, limit)
 
         try:
             if self.db is None:
                 self.logger.error("Cannot get chat messages - database not connected")
                 return []
                 
-            from bson import ObjectId
-            chat_doc = self.db.chats.find_one({'game_session_id': ObjectId(game_session_id), 'deleted': {'$ne': True}})
+            # With a limit only the newest messages are needed, so slice the array server-side
+            projection = {'messages': {'$slice': -limit}} if limit else None
+            chat_doc = self.db.chats.find_one(
+                {'game_session_id': session_object_id(game_session_id), 'deleted': {'$ne': True}},
+                projection,
+            )
 
             if not chat_doc or 'messages' not in chat_doc:
-                self.logger.debug(f"No chat document or messages found for session: {game_session_id}")
+                self.logger.debug("No chat document or messages found for session: %s", game_session_id)
                 return []
                 
             messages_payload = chat_doc.get('messages', [])
@@ -220,11 +220,6 @@ class DbChatActions:
                 self.logger.error("Messages payload malformed for session: %s", game_session_id)
                 return []
 
-            original_count = len(messages_payload)
-
-            if limit and len(messages_payload) > limit:
-                messages_payload = messages_payload[-limit:]
-
             messages: List[Message] = []
             for raw_message in messages_payload:
                 if isinstance(raw_message, Message):
@@ -241,7 +236,7 @@ class DbChatActions:
 
                     message = Message.from_dict(raw_message)
                     if message.timestamp is None:
-                        message.timestamp = datetime.utcnow().isoformat()
+                        message.timestamp = utcnow().isoformat()
                     messages.append(message)
                 else:
                     self.logger.warning(
@@ -251,10 +246,9 @@ class DbChatActions:
                     )
 
             duration = time.time() - start_time
-            self.logger.debug(f"Retrieved {len(messages)}/{original_count} chat messages for session: {game_session_id}")
+            self.logger.debug("Retrieved %d chat messages for session: %s", len(messages), game_session_id)
             StoryOSLogger.log_performance("database", "get_chat_messages", duration, {
                 "game_session_id": game_session_id,
-                "total_messages": original_count,
                 "returned_messages": len(messages),
                 "limit": limit
             })
@@ -266,6 +260,40 @@ class DbChatActions:
             StoryOSLogger.log_error_with_context("database", e, {"operation": "get_chat_messages", "game_session_id": game_session_id})
             st.error(f"Error getting chat messages: {str(e)}")
             return []
+
+    def get_chat_message(self, game_session_id: str, message_id: str) -> Optional[Message]:
+        """Get a single chat message by its message_id without loading the rest of the chat"""
+        start_time = time.time()
+        self.logger.debug("Getting chat message %s for session: %s", message_id, game_session_id)
+
+        try:
+            if self.db is None:
+                self.logger.error("Database not connected - cannot get chat message")
+                return None
+
+            # $elemMatch returns just the matching element of the messages array
+            chat_doc = self.db.chats.find_one(
+                {'game_session_id': session_object_id(game_session_id), 'deleted': {'$ne': True}},
+                {'messages': {'$elemMatch': {'message_id': message_id}}},
+            )
+            raw_messages = chat_doc.get('messages') if chat_doc else None
+            if not raw_messages or not isinstance(raw_messages[0], dict):
+                self.logger.debug("Chat message %s not found for session: %s", message_id, game_session_id)
+                return None
+
+            message = Message.from_dict(raw_messages[0])
+            duration = time.time() - start_time
+            StoryOSLogger.log_performance("database", "get_chat_message", duration, {
+                "game_session_id": game_session_id,
+                "message_id": message_id
+            })
+
+            return message
+
+        except Exception as e:
+            self.logger.error("Error getting chat message %s for session %s: %s", message_id, game_session_id, e)
+            StoryOSLogger.log_error_with_context("database", e, {"operation": "get_chat_message", "game_session_id": game_session_id})
+            return None
         
     def add_image_url_to_visual_prompt(
         self,
@@ -276,72 +304,40 @@ class DbChatActions:
     ) -> bool:
         """Add an image URL to a specific visual prompt in a chat message."""
         start_time = time.time()
-        self.logger.debug(f"Adding image URL to visual prompt for session {session_id}, message {message_id}")
+        self.logger.debug("Adding image URL to visual prompt for session %s, message %s", session_id, message_id)
 
         try:
             if self.db is None:
                 self.logger.error("Cannot update visual prompt - database not connected")
                 return False
 
-            from bson import ObjectId
-
-            chat_doc = self.db.chats.find_one({'game_session_id': ObjectId(session_id), 'deleted': {'$ne': True}})
-            if not chat_doc or 'messages' not in chat_doc:
-                self.logger.warning(f"No chat document found for session: {session_id}")
-                return False
-
-            raw_messages = chat_doc.get('messages', [])
-            if not isinstance(raw_messages, list):
-                self.logger.error("Message payload malformed for session: %s", session_id)
-                return False
-            
-            # Convert raw messages to Message objects
-            messages: List[Message] = []
-            for raw_message in raw_messages:
-                if isinstance(raw_message, Message):
-                    messages.append(raw_message)
-                elif isinstance(raw_message, dict):
-                    message = Message.from_dict(raw_message)
-                    if message.timestamp is None:
-                        message.timestamp = datetime.utcnow().isoformat()
-                    messages.append(message)
-                else:
-                    self.logger.warning(
-                        "Encountered unexpected message payload type %s for session %s",
-                        type(raw_message),
-                        session_id,
-                    )
-            
-            # Find the message with the matching message_id field
-            message = self.find_message(messages, str(message_id))
-            
+            message = self.get_chat_message(session_id, str(message_id))
             if message is None:
                 self.logger.warning(
-                    "No message found with message_id %s in session %s (total messages=%s)",
+                    "No message found with message_id %s in session %s",
                     message_id,
                     session_id,
-                    len(messages),
                 )
                 return False
-            
+
             if not message.visual_prompts or not isinstance(message.visual_prompts, dict):
                 message.visual_prompts = {}
 
             # Update or add the image URL for the given prompt
             message.visual_prompts[prompt] = image_url
+            update_fields: Dict[str, Any] = {'messages.$.visual_prompts': message.visual_prompts}
             if message.timestamp is None:
-                message.timestamp = datetime.utcnow().isoformat()
-
-            # Convert messages to JSON/dict format for MongoDB storage
-            serialized_messages = [
-                {key: value for key, value in msg.to_dict().items() if value is not None}
-                for msg in messages
-            ]
+                update_fields['messages.$.timestamp'] = utcnow().isoformat()
 
-            # Store messages as dictionaries that MongoDB can handle
+            # Positional update of the one message instead of rewriting the whole messages array.
+            # Prompts are used as keys, so the map is set whole rather than by dotted path.
             result = self.db.chats.update_one(
-                {'_id': chat_doc['_id']},
-                {'$set': {'messages': serialized_messages}}
+                {
+                    'game_session_id': session_object_id(session_id),
+                    'deleted': {'$ne': True},
+                    'messages.message_id': str(message_id),
+                },
+                {'$set': update_fields}
             )
 
             duration = time.time() - start_time
@@ -367,16 +363,18 @@ class DbChatActions:
     def add_visual_prompts_to_latest_message(self, session_id: str, prompts: VisualPrompts) -> bool:
         """Attach visualization prompts to the latest chat message for a session."""
         start_time = time.time()
-        self.logger.debug(f"Adding visual prompts to latest message for session: {session_id}")
+        self.logger.debug("Adding visual prompts to latest message for session: %s", session_id)
 
         try:
             if self.db is None:
                 self.logger.error("Cannot update chat message - database not connected")
                 return False
 
-            from bson import ObjectId
-
-            chat_doc = self.db.chats.find_one({'game_session_id': ObjectId(session_id), 'deleted': {'$ne': True}})
+            # Only the sender and timestamp of each message are needed to find the target
+            chat_doc = self.db.chats.find_one(
+                {'game_session_id': session_object_id(session_id), 'deleted': {'$ne': True}},
+                {'messages.sender': 1, 'messages.timestamp': 1},
+            )
             if not chat_doc or 'messages' not in chat_doc:
                 self.logger.warning(f"No chat document found for session: {session_id}")
                 return False
@@ -396,48 +394,29 @@ class DbChatActions:
                 prompts.visual_prompt_3: ""
             }
 
-            messages: List[Message] = []
-            for raw_message in raw_messages:
-                if isinstance(raw_message, Message):
-                    messages.append(raw_message)
-                elif isinstance(raw_message, dict):
-                    messages.append(Message.from_dict(raw_message))
-                else:
-                    self.logger.warning(
-                        "Unexpected message type %s in session %s",
-                        type(raw_message),
-                        session_id,
-                    )
-                    continue
-
-            if not messages:
-                self.logger.warning("No parsable messages found for session: %s", session_id)
-                return False
-
             # Find the latest message from dungeon_master/StoryOS, not just the latest message
             latest_dm_message = None
             latest_dm_index = None
-            for idx, message in enumerate(reversed(messages)):
-                if message.sender in ['dungeon_master', 'StoryOS', 'story']:
-                    latest_dm_message = message
-                    latest_dm_index = len(messages) - 1 - idx  # Get actual index in forward direction
+            for idx in range(len(raw_messages) - 1, -1, -1):
+                raw_message = raw_messages[idx]
+                if isinstance(raw_message, dict) and raw_message.get('sender') in ['dungeon_master', 'StoryOS', 'story']:
+                    latest_dm_message = raw_message
+                    latest_dm_index = idx
                     break
 
             if not latest_dm_message or latest_dm_index is None:
                 self.logger.warning("No dungeon master message found for session: %s", session_id)
                 return False
 
-            latest_dm_message.visual_prompts = visual_prompts_payload
-            if latest_dm_message.timestamp is None:
-                latest_dm_message.timestamp = datetime.utcnow().isoformat()
+            update_fields: Dict[str, Any] = {f'messages.{latest_dm_index}.visual_prompts': visual_prompts_payload}
+            if latest_dm_message.get('timestamp') is None:
+                update_fields[f'messages.{latest_dm_index}.timestamp'] = utcnow().isoformat()
 
             # Use atomic update to only modify the specific message, not replace entire array
             # This prevents race conditions where messages added after our read get lost
-            message_dict = {key: value for key, value in latest_dm_message.to_dict().items() if value is not None}
-
             result = self.db.chats.update_one(
                 {'_id': chat_doc['_id']},
-                {'$set': {f'messages.{latest_dm_index}': message_dict}}
+                {'$set': update_fields}
             )
 
             duration = time.time() - start_time
@@ -448,7 +427,7 @@ class DbChatActions:
 
             success = result.modified_count > 0
             if success:
-                self.logger.debug(f"Visual prompts appended to latest message for session: {session_id}")
+                self.logger.debug("Visual prompts appended to latest message for session: %s", session_id)
             else:
                 self.logger.warning(f"No messages updated when attaching visual prompts for session: {session_id}")
 
@@ -478,9 +457,15 @@ class DbChatActions:
                 self.logger.error("Cannot fetch visual prompts - database not connected")
                 return {}
 
-            from bson import ObjectId
+            if message_id < 0:
+                self.logger.warning("Chat index %s out of range for session %s", message_id, session_id)
+                return {}
 
-            chat_doc = self.db.chats.find_one({'game_session_id': ObjectId(session_id), 'deleted': {'$ne': True}})
+            # $slice returns just the requested message instead of the whole chat history
+            chat_doc = self.db.chats.find_one(
+                {'game_session_id': session_object_id(session_id), 'deleted': {'$ne': True}},
+                {'messages': {'$slice': [message_id, 1]}},
+            )
             if not chat_doc:
                 self.logger.warning("No chat document found for session: %s", session_id)
                 return {}
@@ -490,16 +475,11 @@ class DbChatActions:
                 self.logger.error("Messages payload malformed for session: %s", session_id)
                 return {}
 
-            if message_id < 0 or message_id >= len(messages_payload):
-                self.logger.warning(
-                    "Chat index %s out of range for session %s (messages=%s)",
-                    message_id,
-                    session_id,
-                    len(messages_payload),
-                )
+            if not messages_payload:
+                self.logger.warning("Chat index %s out of range for session %s", message_id, session_id)
                 return {}
 
-            raw_message = messages_payload[message_id]
+            raw_message = messages_payload[0]
             if isinstance(raw_message, Message):
                 message = raw_message
             elif isinstance(raw_message, dict):
@@ -557,11 +537,9 @@ class DbChatActions:
                 self.logger.error("Cannot delete chat - database not connected")
                 return False
 
-            from bson import ObjectId
-
             result = self.db.chats.update_one(
-                {'game_session_id': ObjectId(session_id)},
-                {'$set': {'deleted': True, 'deleted_at': datetime.utcnow().isoformat()}}
+                {'game_session_id': session_object_id(session_id)},
+                {'$set': {'deleted': True, 'deleted_at': utcnow().isoformat()}}
             )
 
             duration = time.time() - start_time
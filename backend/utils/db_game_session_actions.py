@@ -4,16 +4,26 @@ Handles CRUD operations for game sessions in MongoDB
 """
 
 import time
+from functools import lru_cache
 from backend.utils.streamlit_shim import st
-from datetime import datetime
 from typing import Dict, List, Optional, Any
+from bson import ObjectId
+from bson.errors import InvalidId
+from pymongo import ReturnDocument
 from pymongo.database import Database
 from backend.logging_config import get_logger, StoryOSLogger
+from backend.utils.time_utils import utcnow
 
 # Model imports
 from backend.models.game_session_model import GameSession
 
 
+@lru_cache(maxsize=1024)
+def session_object_id(session_id: str) -> ObjectId:
+    """Parse a session ID once; every DB call for the same session reuses the ObjectId"""
+    return ObjectId(session_id)
+
+
 class DbGameSessionActions:
     """Handles game session database operations"""
 
@@ -23,8 +33,8 @@ class DbGameSessionActions:
         self.logger = get_logger("database.game_session_actions")
         self.logger.debug("DbGameSessionActions initialized")
 
-    def create_game_session(self, session_data: GameSession) -> Optional[str]:
-        """Create a new game session"""
+    def create_game_session(self, session_data: GameSession, session_id: Optional[str] = None) -> Optional[str]:
+        """Create a new game session, optionally under a pre-allocated ObjectId"""
         start_time = time.time()
         user_id = session_data.user_id
         scenario_id = session_data.scenario_id
@@ -36,11 +46,13 @@ class DbGameSessionActions:
                 return None
                 
             # Ensure timestamps are set
-            now = datetime.utcnow()
+            now = utcnow()
             session_data.last_updated = now
             
             # Convert GameSession to dictionary for MongoDB insertion
             session_dict = session_data.to_dict()
+            if session_id:
+                session_dict['_id'] = session_object_id(session_id)
                 
             result = self.db.active_game_sessions.insert_one(session_dict)
             session_id = str(result.inserted_id)
@@ -61,20 +73,33 @@ class DbGameSessionActions:
             st.error(f"Error creating game session: {str(e)}")
             return None
 
-    def get_user_game_sessions(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all game sessions for a user"""
+    def get_user_game_sessions(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get game sessions for a user, most recently updated first.
+
+        ``fields`` is an optional MongoDB projection; omit it to load full documents.
+        """
         start_time = time.time()
-        self.logger.debug(f"Retrieving game sessions for user: {user_id}")
+        self.logger.debug("Retrieving game sessions for user: %s", user_id)
         
         try:
             if self.db is None:
                 self.logger.error("Cannot get user game sessions - database not connected")
                 return []
                 
-            sessions = list(self.db.active_game_sessions.find({'user_id': user_id, 'deleted': {'$ne': True}}))
+            cursor = self.db.active_game_sessions.find(
+                {'user_id': user_id, 'deleted': {'$ne': True}}, fields
+            ).sort('last_updated', -1)
+            if limit:
+                cursor = cursor.limit(limit)
+            sessions = list(cursor)
             duration = time.time() - start_time
             
-            self.logger.debug(f"Retrieved {len(sessions)} game sessions for user: {user_id}")
+            self.logger.debug("Retrieved %d game sessions for user: %s", len(sessions), user_id)
             StoryOSLogger.log_performance("database", "get_user_game_sessions", duration, {
                 "user_id": user_id,
                 "session_count": len(sessions)
@@ -88,23 +113,56 @@ class DbGameSessionActions:
             st.error(f"Error getting user game sessions: {str(e)}")
             return []
 
+    def user_owns_game_session(self, user_id: str, session_id: str) -> bool:
+        """Check that a live session with this ID belongs to the user, reading only its _id"""
+        start_time = time.time()
+        self.logger.debug("Checking ownership of game session %s for user: %s", session_id, user_id)
+
+        try:
+            if self.db is None:
+                self.logger.error("Cannot check game session ownership - database not connected")
+                return False
+
+            try:
+                object_id = session_object_id(session_id)
+            except InvalidId:
+                self.logger.debug("Invalid game session ID: %s", session_id)
+                return False
+
+            session = self.db.active_game_sessions.find_one(
+                {'_id': object_id, 'user_id': user_id, 'deleted': {'$ne': True}},
+                {'_id': 1},
+            )
+            duration = time.time() - start_time
+
+            StoryOSLogger.log_performance("database", "user_owns_game_session", duration, {
+                "user_id": user_id,
+                "session_id": session_id,
+                "found": session is not None
+            })
+            return session is not None
+
+        except Exception as e:
+            self.logger.error("Error checking game session ownership %s: %s", session_id, e)
+            StoryOSLogger.log_error_with_context("database", e, {"operation": "user_owns_game_session", "session_id": session_id, "user_id": user_id})
+            return False
+
     def get_game_session(self, session_id: str) -> GameSession:
         """Get game session by ID"""
         start_time = time.time()
-        self.logger.debug(f"Retrieving game session: {session_id}")
+        self.logger.debug("Retrieving game session: %s", session_id)
         
         try:
             if self.db is None:
                 self.logger.error("Cannot get game session - database not connected")
                 raise ValueError("Database not connected")
                 
-            from bson import ObjectId
-            session = self.db.active_game_sessions.find_one({'_id': ObjectId(session_id), 'deleted': {'$ne': True}})
+            session = self.db.active_game_sessions.find_one({'_id': session_object_id(session_id), 'deleted': {'$ne': True}})
             duration = time.time() - start_time
             
             if session:
                 user_id = session.get('user_id', 'unknown')
-                self.logger.debug(f"Game session found: {session_id} for user: {user_id}")
+                self.logger.debug("Game session found: %s for user: %s", session_id, user_id)
                 StoryOSLogger.log_performance("database", "get_game_session", duration, {
                     "session_id": session_id,
                     "user_id": user_id,
@@ -113,7 +171,7 @@ class DbGameSessionActions:
                 game_session = GameSession.from_dict(session)  # Validate and convert to GameSession
                 return game_session
             else:
-                self.logger.debug(f"Game session not found: {session_id}")
+                self.logger.debug("Game session not found: %s", session_id)
                 StoryOSLogger.log_performance("database", "get_game_session", duration, {
                     "session_id": session_id,
                     "found": False
@@ -136,20 +194,19 @@ class DbGameSessionActions:
         session_id: str = session.id
 
         for attempt in range(1, max_retries + 1):
-            self.logger.debug(f"Updating game session (attempt {attempt}/{max_retries}): {session_id}")
+            self.logger.debug("Updating game session (attempt %d/%d): %s", attempt, max_retries, session_id)
 
             try:
                 if self.db is None:
                     self.logger.error("Cannot update game session - database not connected")
                     return False
 
-                from bson import ObjectId
-
                 # Get current version from the session object
                 current_version = getattr(session, 'version', 1)
 
-                # Prepare update data
-                update_data = session.to_dict()
+                # Prepare update data; only the fields changed through the session's update
+                # helpers when they are tracked, so the whole document isn't re-serialized
+                update_data = session.to_update_dict() or session.to_dict()
 
                 # Remove _id and version from update data
                 if '_id' in update_data:
@@ -158,13 +215,13 @@ class DbGameSessionActions:
                     del update_data['version']
 
                 # Update timestamps and increment version
-                update_data['last_updated'] = datetime.utcnow().isoformat()
+                update_data['last_updated'] = utcnow().isoformat()
                 new_version = current_version + 1
 
                 # Atomic update with version check
                 result = self.db.active_game_sessions.update_one(
                     {
-                        '_id': ObjectId(session_id),
+                        '_id': session_object_id(session_id),
                         'version': current_version
                     },
                     {
@@ -193,8 +250,9 @@ class DbGameSessionActions:
                 # Success
                 duration = time.time() - start_time
                 session.version = new_version  # Update in-memory version
+                session.clear_dirty_fields()
 
-                self.logger.debug(f"Game session updated successfully: {session_id} (version {current_version} -> {new_version})")
+                self.logger.debug("Game session updated successfully: %s (version %s -> %s)", session_id, current_version, new_version)
                 StoryOSLogger.log_performance("database", "update_game_session", duration, {
                     "session_id": session_id,
                     "attempts": attempt,
@@ -216,84 +274,57 @@ class DbGameSessionActions:
 
         return False
 
-    def update_game_session_fields(self, session_id: str, updates: Dict[str, Any], max_retries: int = 3) -> bool:
-        """Update specific fields of a game session with optimistic locking"""
+    def update_game_session_fields(self, session_id: str, updates: Dict[str, Any]) -> bool:
+        """Update specific fields of a game session and bump its version atomically"""
         start_time = time.time()
+        self.logger.debug("Updating game session fields: %s, fields: %s", session_id, list(updates))
 
-        for attempt in range(1, max_retries + 1):
-            self.logger.debug(f"Updating game session fields (attempt {attempt}/{max_retries}): {session_id}, fields: {list(updates.keys())}")
-
-            try:
-                if self.db is None:
-                    self.logger.error("Cannot update game session - database not connected")
-                    return False
-
-                from bson import ObjectId
-
-                # Get current document to read version
-                current_doc = self.db.active_game_sessions.find_one(
-                    {'_id': ObjectId(session_id), 'deleted': {'$ne': True}},
-                    {'version': 1}
-                )
-
-                if not current_doc:
-                    self.logger.error(f"Game session not found: {session_id}")
-                    return False
-
-                current_version = current_doc.get('version', 1)
-
-                # Prepare update data
-                update_data = {**updates, 'last_updated': datetime.utcnow().isoformat()}
-
-                # Don't allow version to be updated directly
-                if 'version' in update_data:
-                    del update_data['version']
-
-                # Atomic update with version check
-                result = self.db.active_game_sessions.update_one(
-                    {
-                        '_id': ObjectId(session_id),
-                        'version': current_version
-                    },
-                    {
-                        '$set': update_data,
-                        '$inc': {'version': 1}
-                    }
-                )
-
-                if result.matched_count == 0:
-                    # Version mismatch - retry
-                    if attempt < max_retries:
-                        self.logger.warning(f"Version conflict updating session fields for {session_id}, retrying (attempt {attempt}/{max_retries})")
-                        time.sleep(0.05 * attempt)  # Exponential backoff
-                        continue
-                    else:
-                        self.logger.error(f"Version conflict persisted after {max_retries} attempts for session {session_id}")
-                        return False
-
-                # Success
-                duration = time.time() - start_time
-                new_version = current_version + 1
-
-                self.logger.debug(f"Game session fields updated successfully: {session_id} (version {current_version} -> {new_version})")
-                StoryOSLogger.log_performance("database", "update_game_session_fields", duration, {
-                    "session_id": session_id,
-                    "attempts": attempt,
-                    "version": new_version,
-                    "fields": list(updates.keys())
-                })
-                return True
+        try:
+            if self.db is None:
+                self.logger.error("Cannot update game session - database not connected")
+                return False
+
+            # Prepare update data
+            update_data = {**updates, 'last_updated': utcnow().isoformat()}
+
+            # Don't allow version to be updated directly
+            if 'version' in update_data:
+                del update_data['version']
+
+            # The $set does not depend on the stored values, so apply it and bump the
+            # version in a single round trip; with no version check there is nothing
+            # to conflict on, so there is no retry loop
+            updated_doc = self.db.active_game_sessions.find_one_and_update(
+                {'_id': session_object_id(session_id), 'deleted': {'$ne': True}},
+                {
+                    '$set': update_data,
+                    '$inc': {'version': 1}
+                },
+                projection={'version': 1},
+                return_document=ReturnDocument.AFTER,
+            )
+
+            if not updated_doc:
+                self.logger.error("Game session not found: %s", session_id)
+                return False
+
+            # Success
+            duration = time.time() - start_time
+            new_version = updated_doc.get('version')
 
-            except Exception as e:
-                self.logger.error(f"Error updating game session fields {session_id}: {str(e)}")
-                StoryOSLogger.log_error_with_context("database", e, {
-                    "operation": "update_game_session_fields",
-                    "session_id": session_id,
-                    "attempt": attempt
-                })
-                if attempt == max_retries:
-                    st.error(f"Error updating game session: {str(e)}")
-                    return False
-                time.sleep(0.05 * attempt)  # Exponential backoff
+            self.logger.debug("Game session fields updated successfully: %s (version %s)", session_id, new_version)
+            StoryOSLogger.log_performance("database", "update_game_session_fields", duration, {
+                "session_id": session_id,
+                "version": new_version,
+                "fields": list(updates.keys())
+            })
+            return True
 
-        return False
+        except Exception as e:
+            self.logger.error(f"Error updating game session fields {session_id}: {str(e)}")
+            StoryOSLogger.log_error_with_context("database", e, {
+                "operation": "update_game_session_fields",
+                "session_id": session_id
+            })
+            st.error(f"Error updating game session: {str(e)}")
+            return False
@@ -5,7 +5,7 @@ Handles scenario-related MongoDB operations
 
 import time
 from datetime import datetime
-from typing import List, Optional
+from typing import Any, Dict, List, Optional
 
 from pymongo.database import Database
 
@@ -23,7 +23,7 @@ class DbScenarioActions:
     
     def create_scenario(self, scenario: Scenario) -> bool:
         """Create a new scenario"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         scenario_id = scenario.scenario_id
         self.logger.info(f"Creating scenario: {scenario_id}")
 
@@ -37,7 +37,7 @@ class DbScenarioActions:
 
             result = self.db.scenarios.insert_one(scenario_dict)
             success = result.inserted_id is not None
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             if success:
                 self.logger.info(f"Scenario created successfully: {scenario_id}")
@@ -55,51 +55,53 @@ class DbScenarioActions:
             StoryOSLogger.log_error_with_context("database", e, {"operation": "create_scenario", "scenario_id": scenario_id})
             return False
     
+    @staticmethod
+    def _visible_scenarios_query(user_id: Optional[str]) -> Dict[str, Any]:
+        """Build the scenario visibility filter for ``user_id`` (None = every scenario)"""
+        if user_id is None:
+            # Return all scenarios (for admin users)
+            return {}
+        if user_id:
+            # Return public scenarios or user's own scenarios
+            return {
+                "$or": [
+                    {"visibility": "public"},
+                    {"author": user_id}
+                ]
+            }
+        # Fallback: return only public scenarios
+        return {"visibility": "public"}
+
     def get_all_scenarios(self, user_id: Optional[str] = None) -> List[Scenario]:
         """Get all scenarios visible to the user (public scenarios or user's own scenarios)
 
         If user_id is None, returns all scenarios (for admin users)
         """
-        start_time = time.time()
-        self.logger.debug(f"Retrieving scenarios for user: {user_id}")
+        start_time = time.perf_counter()
+        self.logger.debug("Retrieving scenarios for user: %s", user_id)
 
         try:
             if self.db is None:
                 self.logger.error("Database not connected - cannot get scenarios")
                 return []
 
-            # Build query based on user_id
-            if user_id is None:
-                # Return all scenarios (for admin users)
-                query = {}
-            elif user_id:
-                # Return public scenarios or user's own scenarios
-                query = {
-                    "$or": [
-                        {"visibility": "public"},
-                        {"author": user_id}
-                    ]
-                }
-            else:
-                # Fallback: return only public scenarios
-                query = {"visibility": "public"}
+            query = self._visible_scenarios_query(user_id)
 
-            scenarios_data = list(self.db.scenarios.find(query))
-            duration = time.time() - start_time
+            # MongoDB's _id is not part of the Scenario model, so leave it out server-side
+            scenarios_data = list(self.db.scenarios.find(query, {'_id': 0}))
+            duration = time.perf_counter() - start_time
 
             # Convert to Scenario models
             scenarios = []
             for scenario_dict in scenarios_data:
                 try:
-                    # Remove MongoDB's _id field if present
-                    scenario_dict.pop('_id', None)
                     scenarios.append(Scenario(**scenario_dict))
                 except Exception as e:
                     scenario_id = scenario_dict.get('scenario_id', 'unknown')
                     self.logger.warning(f"Failed to instantiate scenario {scenario_id}: {str(e)} - skipping")
                     continue
 
-            self.logger.debug(f"Retrieved {len(scenarios)} scenarios for user {user_id}")
+            self.logger.debug("Retrieved %d scenarios for user %s", len(scenarios), user_id)
             StoryOSLogger.log_performance("database", "get_all_scenarios", duration, {
                 "count": len(scenarios),
                 "user_id": user_id
@@ -112,10 +114,64 @@ class DbScenarioActions:
             StoryOSLogger.log_error_with_context("database", e, {"operation": "get_all_scenarios", "user_id": user_id})
             return []
     
+    def get_scenario_summaries(self, fields: List[str], user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get only the given fields of the scenarios visible to the user
+
+        Used for listings, so prompts and storylines are never sent over the wire.
+        """
+        start_time = time.perf_counter()
+        self.logger.debug("Retrieving scenario summaries for user: %s", user_id)
+
+        try:
+            if self.db is None:
+                self.logger.error("Database not connected - cannot get scenario summaries")
+                return []
+
+            projection: Dict[str, Any] = {field: 1 for field in fields}
+            projection['_id'] = 0
+            summaries = list(self.db.scenarios.find(self._visible_scenarios_query(user_id), projection))
+            duration = time.perf_counter() - start_time
+
+            self.logger.debug("Retrieved %d scenario summaries for user %s", len(summaries), user_id)
+            StoryOSLogger.log_performance("database", "get_scenario_summaries", duration, {
+                "count": len(summaries),
+                "user_id": user_id
+            })
+
+            return summaries
+
+        except Exception as e:
+            self.logger.error(f"Error getting scenario summaries: {str(e)}")
+            StoryOSLogger.log_error_with_context("database", e, {"operation": "get_scenario_summaries", "user_id": user_id})
+            return []
+
+    def get_scenario_count(self) -> int:
+        """Get total number of scenarios"""
+        start_time = time.perf_counter()
+        self.logger.debug("Getting scenario count")
+
+        try:
+            if self.db is None:
+                self.logger.error("Database not connected - cannot count scenarios")
+                return 0
+
+            count = self.db.scenarios.count_documents({})
+            duration = time.perf_counter() - start_time
+
+            self.logger.debug("Scenario count: %d", count)
+            StoryOSLogger.log_performance("database", "get_scenario_count", duration, {"count": count})
+
+            return count
+
+        except Exception as e:
+            self.logger.error(f"Error counting scenarios: {str(e)}")
+            StoryOSLogger.log_error_with_context("database", e, {"operation": "get_scenario_count"})
+            return 0
+
     def get_scenario(self, scenario_id: str) -> Optional[Scenario]:
         """Get scenario by scenario_id"""
-        start_time = time.time()
-        self.logger.debug(f"Retrieving scenario: {scenario_id}")
+        start_time = time.perf_counter()
+        self.logger.debug("Retrieving scenario: %s", scenario_id)
 
         try:
             if self.db is None:
@@ -123,21 +179,21 @@ class DbScenarioActions:
                 return None
 
             scenario_dict = self.db.scenarios.find_one({'scenario_id': scenario_id})
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             if scenario_dict:
                 # Remove MongoDB's _id field if present
                 scenario_dict.pop('_id', None)
                 scenario = Scenario(**scenario_dict)
 
-                self.logger.debug(f"Scenario found: {scenario_id}")
+                self.logger.debug("Scenario found: %s", scenario_id)
                 StoryOSLogger.log_performance("database", "get_scenario", duration, {
                     "scenario_id": scenario_id,
                     "found": True
                 })
                 return scenario
             else:
-                self.logger.debug(f"Scenario not found: {scenario_id}")
+                self.logger.debug("Scenario not found: %s", scenario_id)
                 StoryOSLogger.log_performance("database", "get_scenario", duration, {
                     "scenario_id": scenario_id,
                     "found": False
@@ -151,7 +207,7 @@ class DbScenarioActions:
     
     def update_scenario(self, scenario: Scenario) -> bool:
         """Update a scenario"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         scenario_id = scenario.scenario_id
         self.logger.info(f"Updating scenario: {scenario_id}")
 
@@ -169,7 +225,7 @@ class DbScenarioActions:
             )
 
             success = result.modified_count > 0
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             if success:
                 self.logger.info(f"Scenario updated successfully: {scenario_id}")
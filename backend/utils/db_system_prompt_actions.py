@@ -4,13 +4,13 @@ Handles system prompt-related MongoDB operations
 """
 
 import time
-from datetime import datetime
 from typing import Dict, List, Optional, Any
 
-from backend.utils.streamlit_shim import st
+from pymongo import ReturnDocument
 from pymongo.database import Database
 
 from backend.logging_config import get_logger, StoryOSLogger
+from backend.utils.time_utils import utcnow
 
 
 class DbSystemPromptActions:
@@ -23,9 +23,9 @@ class DbSystemPromptActions:
     
     def create_system_prompt(self, prompt_data: Dict[str, Any]) -> bool:
         """Create a new system prompt"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         prompt_name = prompt_data.get('name', 'unnamed')
-        self.logger.info(f"Creating system prompt: {prompt_name}")
+        self.logger.info("Creating system prompt: %s", prompt_name)
         
         try:
             if self.db is None:
@@ -33,7 +33,7 @@ class DbSystemPromptActions:
                 return False
                 
             # Ensure timestamps are set
-            now = datetime.utcnow().isoformat()
+            now = utcnow().isoformat()
             if 'created_at' not in prompt_data:
                 prompt_data['created_at'] = now
             if 'updated_at' not in prompt_data:
@@ -41,28 +41,27 @@ class DbSystemPromptActions:
                 
             result = self.db.system_prompts.insert_one(prompt_data)
             success = result.inserted_id is not None
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
             if success:
-                self.logger.info(f"System prompt created successfully: {prompt_name}")
+                self.logger.info("System prompt created successfully: %s", prompt_name)
                 StoryOSLogger.log_performance("database", "create_system_prompt", duration, {
                     "prompt_name": prompt_name,
                     "success": True
                 })
             else:
-                self.logger.error(f"Failed to create system prompt: {prompt_name}")
+                self.logger.error("Failed to create system prompt: %s", prompt_name)
                 
             return success
             
         except Exception as e:
-            self.logger.error(f"Error creating system prompt {prompt_name}: {str(e)}")
+            self.logger.error("Error creating system prompt %s: %s", prompt_name, e)
             StoryOSLogger.log_error_with_context("database", e, {"operation": "create_system_prompt", "prompt_name": prompt_name})
-            st.error(f"Error creating system prompt: {str(e)}")
             return False
     
     def get_active_system_prompt(self) -> Dict[str, Any]:
         """Get the active system prompt"""
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.logger.debug("Retrieving active system prompt")
 
         try:
@@ -71,10 +70,10 @@ class DbSystemPromptActions:
                 raise LookupError("Database not connected")
 
             prompt = self.db.system_prompts.find_one({'active': True, 'name': 'Default StoryOS System Prompt'})
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
 
             if prompt:
-                self.logger.debug(f"Active system prompt found: {prompt.get('name', 'unnamed')}")
+                self.logger.debug("Active system prompt found: %s", prompt.get('name', 'unnamed'))
                 StoryOSLogger.log_performance("database", "get_active_system_prompt", duration, {
                     "found": True,
                     "prompt_name": prompt.get('name', 'unnamed')
@@ -89,14 +88,13 @@ class DbSystemPromptActions:
             return prompt
 
         except Exception as e:
-            self.logger.error(f"Error getting active system prompt: {str(e)}")
+            self.logger.error("Error getting active system prompt: %s", e)
             StoryOSLogger.log_error_with_context("database", e, {"operation": "get_active_system_prompt"})
-            st.error(f"Error getting active system prompt: {str(e)}")
             raise
 
     def get_active_visualization_system_prompt(self) -> str:
         """Get the active visualization system prompt content."""
-        start_time = time.time()
+        start_time = time.perf_counter()
         self.logger.debug("Retrieving active visualization system prompt")
 
         try:
@@ -104,11 +102,15 @@ class DbSystemPromptActions:
                 self.logger.error("Database not connected - cannot get visualization system prompt")
                 raise LookupError("Database not connected")
 
-            prompt_doc = self.db.system_prompts.find_one({
-                'active': True,
-                'name': 'Default StoryOS Visualization System Prompt'
-            })
-            duration = time.time() - start_time
+            # Callers only need the prompt text
+            prompt_doc = self.db.system_prompts.find_one(
+                {
+                    'active': True,
+                    'name': 'Default StoryOS Visualization System Prompt'
+                },
+                {'content': 1, '_id': 0},
+            )
+            duration = time.perf_counter() - start_time
 
             if prompt_doc and 'content' in prompt_doc:
                 self.logger.debug("Active visualization system prompt found")
@@ -124,100 +126,109 @@ class DbSystemPromptActions:
             raise LookupError("Active visualization system prompt not found")
 
         except Exception as e:
-            self.logger.error(f"Error getting visualization system prompt: {str(e)}")
+            self.logger.error("Error getting visualization system prompt: %s", e)
             StoryOSLogger.log_error_with_context("database", e, {
                 "operation": "get_active_visualization_system_prompt"
             })
             raise
 
-    def update_visualization_system_prompt(self, content: str) -> bool:
-        """Update the visualization system prompt content"""
-        start_time = time.time()
+    def update_visualization_system_prompt(self, content: str) -> Optional[Dict[str, Any]]:
+        """Update the visualization system prompt content and return the updated document"""
+        start_time = time.perf_counter()
         self.logger.debug("Updating visualization system prompt")
 
         try:
             if self.db is None:
                 self.logger.error("Database not connected - cannot update visualization system prompt")
-                return False
+                return None
 
-            # Update the visualization system prompt by name
-            result = self.db.system_prompts.update_one(
-                {
-                    'active': True,
-                    'name': 'Default StoryOS Visualization System Prompt'
-                },
+            prompt_filter = {
+                'active': True,
+                'name': 'Default StoryOS Visualization System Prompt'
+            }
+            # Update the visualization system prompt by name; saving identical content
+            # matches nothing, so the server skips the write
+            updated_doc = self.db.system_prompts.find_one_and_update(
+                {**prompt_filter, 'content': {'$ne': content}},
                 {
                     '$set': {
                         'content': content,
-                        'updated_at': datetime.utcnow().isoformat()
+                        'updated_at': utcnow().isoformat()
                     }
-                }
+                },
+                return_document=ReturnDocument.AFTER,
             )
-
-            duration = time.time() - start_time
-
-            if result.modified_count > 0:
-                self.logger.info("Visualization system prompt updated successfully")
+            modified_count = 1
+            if not updated_doc:
+                # Either the prompt is missing or it already has this content
+                updated_doc = self.db.system_prompts.find_one(prompt_filter)
+                modified_count = 0
+
+            duration = time.perf_counter() - start_time
+
+            if updated_doc:
+                if modified_count:
+                    self.logger.info("Visualization system prompt updated successfully")
+                else:
+                    self.logger.info("Visualization system prompt unchanged; skipped write")
                 StoryOSLogger.log_performance("database", "update_visualization_system_prompt", duration, {
-                    "modified_count": result.modified_count,
+                    "modified_count": modified_count,
                     "content_length": len(content)
                 })
-                return True
             else:
                 self.logger.warning("No visualization system prompt was updated (may not exist)")
                 StoryOSLogger.log_performance("database", "update_visualization_system_prompt", duration, {
                     "modified_count": 0,
                     "content_length": len(content)
                 })
-                return False
+            return updated_doc
 
         except Exception as e:
-            duration = time.time() - start_time
-            self.logger.error(f"Error updating visualization system prompt: {str(e)}")
+            duration = time.perf_counter() - start_time
+            self.logger.error("Error updating visualization system prompt: %s", e)
             StoryOSLogger.log_error_with_context("database", e, {
                 "operation": "update_visualization_system_prompt",
                 "content_length": len(content) if content else 0,
                 "duration": duration
             })
-            return False
+            return None
 
-    def update_system_prompt(self, prompt_id: str, content: str) -> bool:
-        """Update system prompt content"""
-        start_time = time.time()
-        self.logger.info(f"Updating system prompt: {prompt_id}")
+    def update_system_prompt(self, prompt_id: str, content: str) -> Optional[Dict[str, Any]]:
+        """Update system prompt content and return the updated document"""
+        start_time = time.perf_counter()
+        self.logger.info("Updating system prompt: %s", prompt_id)
 
         try:
             if self.db is None:
                 self.logger.error("Database not connected - cannot update system prompt")
-                return False
+                return None
 
             # Update the specified prompt
-            result = self.db.system_prompts.update_one(
+            updated_doc = self.db.system_prompts.find_one_and_update(
                 {'_id': prompt_id},
                 {
                     '$set': {
                         'content': content,
-                        'updated_at': datetime.utcnow().isoformat()
+                        'updated_at': utcnow().isoformat()
                     }
-                }
+                },
+                return_document=ReturnDocument.AFTER,
             )
             
-            success = result.modified_count > 0
-            duration = time.time() - start_time
+            duration = time.perf_counter() - start_time
             
-            if success:
-                self.logger.info(f"System prompt updated successfully: {prompt_id}")
+            if updated_doc:
+                self.logger.info("System prompt updated successfully: %s", prompt_id)
                 StoryOSLogger.log_performance("database", "update_system_prompt", duration, {
                     "prompt_id": str(prompt_id),
                     "success": True
                 })
             else:
-                self.logger.warning(f"No changes made to system prompt: {prompt_id}")
+                self.logger.warning("No changes made to system prompt: %s", prompt_id)
                 
-            return success
+            return updated_doc
             
         except Exception as e:
-            self.logger.error(f"Error updating system prompt {prompt_id}: {str(e)}")
+            self.logger.error("Error updating system prompt %s: %s", prompt_id, e)
             StoryOSLogger.log_error_with_context("database", e, {"operation": "update_system_prompt", "prompt_id": str(prompt_id)})
-            st.error(f"Error updating system prompt: {str(e)}")
-            return False
+            return None
@@ -4,7 +4,6 @@ Handles user-related MongoDB operations
 """
 
 import time
-from datetime import datetime
 from typing import Dict, List, Optional, Any
 
 from backend.utils.streamlit_shim import st
@@ -12,6 +11,7 @@ from pymongo.errors import DuplicateKeyError
 from pymongo.database import Database
 
 from backend.logging_config import get_logger, StoryOSLogger
+from backend.utils.time_utils import utcnow
 
 
 class DbUserActions:
@@ -36,7 +36,7 @@ class DbUserActions:
                 'user_id': user_id,
                 'password_hash': password_hash,
                 'role': role,
-                'created_at': datetime.utcnow().isoformat()
+                'created_at': utcnow().isoformat()
             }
             
             result = self.db.users.insert_one(user_doc)
@@ -66,27 +66,27 @@ class DbUserActions:
             st.error(f"Error creating user: {str(e)}")
             return False
     
-    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
-        """Get user by user_id"""
+    def get_user(self, user_id: str, fields: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+        """Get user by user_id, optionally limited to a MongoDB projection"""
         start_time = time.time()
-        self.logger.debug(f"Retrieving user: {user_id}")
+        self.logger.debug("Retrieving user: %s", user_id)
         
         try:
             if self.db is None:
                 self.logger.error("Database not connected - cannot get user")
                 return None
                 
-            result = self.db.users.find_one({'user_id': user_id})
+            result = self.db.users.find_one({'user_id': user_id}, fields)
             duration = time.time() - start_time
             
             if result:
-                self.logger.debug(f"User found: {user_id}")
+                self.logger.debug("User found: %s", user_id)
                 StoryOSLogger.log_performance("database", "get_user", duration, {
                     "user_id": user_id,
                     "found": True
                 })
             else:
-                self.logger.debug(f"User not found: {user_id}")
+                self.logger.debug("User not found: %s", user_id)
                 StoryOSLogger.log_performance("database", "get_user", duration, {
                     "user_id": user_id,
                     "found": False
@@ -102,9 +102,9 @@ class DbUserActions:
     
     def user_exists(self, user_id: str) -> bool:
         """Check if user exists"""
-        self.logger.debug(f"Checking if user exists: {user_id}")
+        self.logger.debug("Checking if user exists: %s", user_id)
         exists = self.get_user(user_id) is not None
-        self.logger.debug(f"User {user_id} exists: {exists}")
+        self.logger.debug("User %s exists: %s", user_id, exists)
         return exists
     
     def get_user_count(self) -> int:
@@ -120,7 +120,7 @@ class DbUserActions:
             count = self.db.users.count_documents({})
             duration = time.time() - start_time
 
-            self.logger.debug(f"User count: {count}")
+            self.logger.debug("User count: %s", count)
             StoryOSLogger.log_performance("database", "get_user_count", duration, {"count": count})
 
             return count
@@ -142,7 +142,7 @@ class DbUserActions:
                 return False
 
             # Add updated_at timestamp
-            updates['updated_at'] = datetime.utcnow().isoformat()
+            updates['updated_at'] = utcnow().isoformat()
 
             result = self.db.users.update_one(
                 {'user_id': user_id},
@@ -173,7 +173,7 @@ class DbUserActions:
     def get_users_by_role(self, role: str) -> List[Dict[str, Any]]:
         """Get all users with a specific role"""
         start_time = time.time()
-        self.logger.debug(f"Retrieving users with role: {role}")
+        self.logger.debug("Retrieving users with role: %s", role)
 
         try:
             if self.db is None:
@@ -183,7 +183,7 @@ class DbUserActions:
             users = list(self.db.users.find({'role': role}))
             duration = time.time() - start_time
 
-            self.logger.debug(f"Retrieved {len(users)} users with role {role}")
+            self.logger.debug("Retrieved %s users with role %s", len(users), role)
             StoryOSLogger.log_performance("database", "get_users_by_role", duration, {
                 "role": role,
                 "count": len(users)
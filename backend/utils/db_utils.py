@@ -8,6 +8,7 @@ import pymongo
 from pymongo import MongoClient
 from pymongo.errors import DuplicateKeyError, ServerSelectionTimeoutError, ConnectionFailure
 import os
+import threading
 from datetime import datetime
 from typing import Dict, List, Optional, Any
 from backend.utils.streamlit_shim import st
@@ -33,19 +34,35 @@ from backend.utils.db_visualization_task_actions import DbVisualizationTaskActio
 load_dotenv()
 
 class DatabaseManager:
+    _ACTION_HANDLERS = (
+        "user_actions",
+        "scenario_actions",
+        "system_prompt_actions",
+        "game_session_actions",
+        "chat_actions",
+        "visualization_task_actions",
+    )
+
     def __init__(self):
         self.client: Optional[MongoClient] = None
         self.db: Optional[Database] = None
         self.logger = get_logger("database")
+
+        # Action handlers are built once by _connect when the connection succeeds
+        self.user_actions: Optional[DbUserActions] = None
+        self.scenario_actions: Optional[DbScenarioActions] = None
+        self.system_prompt_actions: Optional[DbSystemPromptActions] = None
+        self.game_session_actions: Optional[DbGameSessionActions] = None
+        self.chat_actions: Optional[DbChatActions] = None
+        self.visualization_task_actions: Optional[DbVisualizationTaskActions] = None
         self._connect()
-        
-        # Initialize action handlers
-        self.user_actions = DbUserActions(self.db) if self.db is not None else None
-        self.scenario_actions = DbScenarioActions(self.db) if self.db is not None else None
-        self.system_prompt_actions = DbSystemPromptActions(self.db) if self.db is not None else None
-        self.game_session_actions = DbGameSessionActions(self.db) if self.db is not None else None
-        self.chat_actions = DbChatActions(self.db) if self.db is not None else None
-        self.visualization_task_actions = DbVisualizationTaskActions(self.db) if self.db is not None else None
+
+    def _reset_connection(self):
+        """Clear the client, database handle and every action handler after a failed connect"""
+        self.client = None
+        self.db = None
+        for handler in self._ACTION_HANDLERS:
+            setattr(self, handler, None)
     
     def _connect(self):
         """Establish MongoDB connection"""
@@ -58,6 +75,8 @@ class DatabaseManager:
             username = os.getenv('MONGODB_USERNAME')
             password = os.getenv('MONGODB_PASSWORD')
             db_name = os.getenv('MONGODB_DATABASE_NAME', 'storyos')
+            # Keep a few connections open so requests after an idle spell skip the TCP/TLS handshake
+            min_pool_size = int(os.getenv('MONGODB_MIN_POOL_SIZE', '5'))
             
             self.logger.debug(f"Database name: {db_name}")
             self.logger.debug(f"MongoDB URI present: {bool(mongodb_uri)}")
@@ -79,7 +98,7 @@ class DatabaseManager:
             
             # Connect to MongoDB
             self.logger.info("Creating MongoDB client connection")
-            self.client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000)
+            self.client = MongoClient(mongodb_uri, serverSelectionTimeoutMS=5000, minPoolSize=min_pool_size)
             self.db = self.client[db_name]
             
             # Test the connection
@@ -106,42 +125,21 @@ class DatabaseManager:
             self.logger.error(f"MongoDB server selection timeout after {duration:.2f}s: {str(e)}")
             StoryOSLogger.log_error_with_context("database", e, {"operation": "connect", "duration": duration})
             st.error("Failed to connect to MongoDB: Connection timeout")
-            self.client = None
-            self.db = None
-            self.user_actions = None
-            self.scenario_actions = None
-            self.system_prompt_actions = None
-            self.game_session_actions = None
-            self.chat_actions = None
-            self.visualization_task_actions = None
+            self._reset_connection()
             
         except ConnectionFailure as e:
             duration = time.time() - start_time
             self.logger.error(f"MongoDB connection failure after {duration:.2f}s: {str(e)}")
             StoryOSLogger.log_error_with_context("database", e, {"operation": "connect", "duration": duration})
             st.error("Failed to connect to MongoDB: Connection failed")
-            self.client = None
-            self.db = None
-            self.user_actions = None
-            self.scenario_actions = None
-            self.system_prompt_actions = None
-            self.game_session_actions = None
-            self.chat_actions = None
-            self.visualization_task_actions = None
+            self._reset_connection()
             
         except Exception as e:
             duration = time.time() - start_time
             self.logger.error(f"Unexpected error during MongoDB connection after {duration:.2f}s: {str(e)}")
             StoryOSLogger.log_error_with_context("database", e, {"operation": "connect", "duration": duration})
             st.error(f"Failed to connect to MongoDB: {str(e)}")
-            self.client = None
-            self.db = None
-            self.user_actions = None
-            self.scenario_actions = None
-            self.system_prompt_actions = None
-            self.game_session_actions = None
-            self.chat_actions = None
-            self.visualization_task_actions = None
+            self._reset_connection()
     
     def is_connected(self):
         """Check if database connection is active"""
@@ -159,12 +157,12 @@ class DatabaseManager:
         self.logger.info(f"DB WRITE: Creating user - user_id={user_id}, role={role}")
         return self.user_actions.create_user(user_id, password_hash, role)
     
-    def get_user(self, user_id: str) -> Optional[Dict[str, Any]]:
+    def get_user(self, user_id: str, fields: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
         """Get user by user_id"""
         if not self.user_actions:
             self.logger.error("User actions not available - database not connected")
             return None
-        return self.user_actions.get_user(user_id)
+        return self.user_actions.get_user(user_id, fields=fields)
     
     def user_exists(self, user_id: str) -> bool:
         """Check if user exists"""
@@ -211,6 +209,20 @@ class DatabaseManager:
             return []
         return self.scenario_actions.get_all_scenarios(user_id=user_id)
 
+    def get_scenario_summaries(self, fields: List[str], user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get the listed fields of the scenarios visible to the user"""
+        if not self.scenario_actions:
+            self.logger.error("Scenario actions not available - database not connected")
+            return []
+        return self.scenario_actions.get_scenario_summaries(fields, user_id=user_id)
+
+    def get_scenario_count(self) -> int:
+        """Get total number of scenarios"""
+        if not self.scenario_actions:
+            self.logger.error("Scenario actions not available - database not connected")
+            return 0
+        return self.scenario_actions.get_scenario_count()
+    
     def get_scenario(self, scenario_id: str) -> Optional[Scenario]:
         """Get scenario by scenario_id"""
         if not self.scenario_actions:
@@ -249,37 +261,49 @@ class DatabaseManager:
             raise LookupError("Database not connected")
         return self.system_prompt_actions.get_active_visualization_system_prompt()
 
-    def update_system_prompt(self, prompt_id: str, content: str) -> bool:
-        """Update system prompt content"""
+    def update_system_prompt(self, prompt_id: str, content: str) -> Optional[Dict[str, Any]]:
+        """Update system prompt content and return the updated document"""
         if not self.system_prompt_actions:
             self.logger.error("System prompt actions not available - database not connected")
-            return False
+            return None
         self.logger.info(f"DB WRITE: Updating system prompt - prompt_id={prompt_id}, content_length={len(content)}")
         return self.system_prompt_actions.update_system_prompt(prompt_id, content)
 
-    def update_visualization_system_prompt(self, content: str) -> bool:
-        """Update visualization system prompt content"""
+    def update_visualization_system_prompt(self, content: str) -> Optional[Dict[str, Any]]:
+        """Update visualization system prompt content and return the updated document"""
         if not self.system_prompt_actions:
             self.logger.error("System prompt actions not available - database not connected")
-            return False
+            return None
         self.logger.info(f"DB WRITE: Updating visualization system prompt - content_length={len(content)}")
         return self.system_prompt_actions.update_visualization_system_prompt(content)
     
     # GAME SESSION OPERATIONS (delegated to DbGameSessionActions)
-    def create_game_session(self, session_data: GameSession) -> Optional[str]:
+    def create_game_session(self, session_data: GameSession, session_id: Optional[str] = None) -> Optional[str]:
         """Create a new game session"""
         if not self.game_session_actions:
             self.logger.error("Game session actions not available - database not connected")
             return None
         self.logger.info(f"DB WRITE: Creating game session - user_id={session_data.user_id}, scenario_id={session_data.scenario_id}")
-        return self.game_session_actions.create_game_session(session_data)
+        return self.game_session_actions.create_game_session(session_data, session_id=session_id)
     
-    def get_user_game_sessions(self, user_id: str) -> List[Dict[str, Any]]:
-        """Get all game sessions for a user"""
+    def get_user_game_sessions(
+        self,
+        user_id: str,
+        limit: Optional[int] = None,
+        fields: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Get game sessions for a user, most recently updated first"""
         if not self.game_session_actions:
             self.logger.error("Game session actions not available - database not connected")
             return []
-        return self.game_session_actions.get_user_game_sessions(user_id)
+        return self.game_session_actions.get_user_game_sessions(user_id, limit=limit, fields=fields)
+
+    def user_owns_game_session(self, user_id: str, session_id: str) -> bool:
+        """Check that a session belongs to a user without loading it"""
+        if not self.game_session_actions:
+            self.logger.error("Game session actions not available - database not connected")
+            return False
+        return self.game_session_actions.user_owns_game_session(user_id, session_id)
     
     def get_game_session(self, session_id: str) -> GameSession:
         """Get game session by ID"""
@@ -336,6 +360,13 @@ class DatabaseManager:
             return []
         return self.chat_actions.get_chat_messages(game_session_id, limit)
 
+    def get_chat_message(self, game_session_id: str, message_id: str) -> Optional[Message]:
+        """Get a single chat message by its message_id"""
+        if not self.chat_actions:
+            self.logger.error("Chat actions not available - database not connected")
+            return None
+        return self.chat_actions.get_chat_message(game_session_id, message_id)
+
     def add_visual_prompts_to_latest_message(self, session_id: str, prompts: VisualPrompts) -> bool:
         """Attach visualization prompts to the latest chat message for a session."""
         if not self.chat_actions:
@@ -423,12 +454,16 @@ class DatabaseManager:
 
 # Global database manager instance
 _db_manager = None
+_db_manager_lock = threading.Lock()
 
 def get_db_manager() -> DatabaseManager:
     """Get the global database manager instance"""
     global _db_manager
     if _db_manager is None:
-        logger = get_logger("database")
-        logger.debug("Creating new DatabaseManager instance")
-        _db_manager = DatabaseManager()
+        # Requests run on worker threads; make sure only one MongoClient is ever built
+        with _db_manager_lock:
+            if _db_manager is None:
+                logger = get_logger("database")
+                logger.debug("Creating new DatabaseManager instance")
+                _db_manager = DatabaseManager()
     return _db_manager
@@ -5,10 +5,10 @@ Handles CRUD operations for Kling visualization tasks in MongoDB
 
 import time
 from backend.utils.streamlit_shim import st
-from datetime import datetime
 from typing import Dict, Optional, Any, List
 from pymongo.database import Database
 from backend.logging_config import get_logger, StoryOSLogger
+from backend.utils.time_utils import utcnow
 
 # Model imports
 from backend.models.visualization_task import VisualizationTask
@@ -36,7 +36,7 @@ class DbVisualizationTaskActions:
                 self.logger.error("Cannot create visualization task - database not connected")
                 return False
 
-            now_iso = datetime.utcnow().isoformat()
+            now_iso = utcnow().isoformat()
             task_record = {
                 key: value
                 for key, value in task_data.items()
@@ -84,7 +84,7 @@ class DbVisualizationTaskActions:
                 self.logger.error("Cannot update visualization task - database not connected")
                 return False
 
-            now_iso = datetime.utcnow().isoformat()
+            now_iso = utcnow().isoformat()
             update_doc = {
                 "$set": {
                     **updates,
@@ -196,7 +196,7 @@ class DbVisualizationTaskActions:
                     self.logger.error(f"Error converting task document to VisualizationTask model for task_id {task_doc.get('task_id', 'unknown')}: {str(model_error)}")
                     continue
             
-            self.logger.debug(f"Retrieved {len(tasks)} visualization tasks for session {session_id}, message {message_id}")
+            self.logger.debug("Retrieved %s visualization tasks for session %s, message %s", len(tasks), session_id, message_id)
             return tasks
 
         except Exception as e:
@@ -220,7 +220,7 @@ class DbVisualizationTaskActions:
 
             result = self.db.visualizations.update_many(
                 {"session_id": session_id},
-                {"$set": {"deleted": True, "deleted_at": datetime.utcnow().isoformat()}}
+                {"$set": {"deleted": True, "deleted_at": utcnow().isoformat()}}
             )
 
             duration = time.time() - start_time
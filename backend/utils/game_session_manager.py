@@ -4,9 +4,11 @@ from __future__ import annotations
 
 import json
 import random
+import threading
 import time
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, List, Optional, Tuple
+from typing import TYPE_CHECKING, Any, Dict, FrozenSet, List, Optional, Tuple
 
 from logging import Logger
 
@@ -16,12 +18,15 @@ from backend.logging_config import StoryOSLogger, get_logger
 from backend.models.game_session_model import GameSession
 from backend.utils.chat_formatter import format_timestamp
 from backend.utils.db_utils import DatabaseManager, get_db_manager
-from backend.utils.llm_utils import LLMUtility, get_llm_utility
+
+if TYPE_CHECKING:
+    from backend.utils.llm_utils import LLMUtility
+
+logger = get_logger("game_session_manager")
 
 
 def generate_session_id() -> int:
     """Generate a unique session identifier."""
-    logger = get_logger("game_session_manager")
     session_id = int(datetime.utcnow().timestamp() * 1000) + random.randint(0, 999)
     logger.debug("Generated session ID: %s", session_id)
     return session_id
@@ -35,6 +40,9 @@ def validate_services_and_session(
     llm_utility: Optional[LLMUtility] = None,
 ) -> Tuple[DatabaseManager, LLMUtility, GameSession]:
     """Validate service availability and retrieve the active session."""
+    # Imported here so listing and export helpers don't load the LLM client libraries
+    from backend.utils.llm_utils import get_llm_utility
+
     db: DatabaseManager = db_manager if db_manager is not None else get_db_manager()
     llm: LLMUtility = llm_utility if llm_utility is not None else get_llm_utility()
 
@@ -55,9 +63,12 @@ def validate_services_and_session(
     return db, llm, session
 
 
-def get_user_game_sessions(user_id: str) -> List[Dict[str, Any]]:
-    """Fetch sessions for the supplied user."""
-    logger = get_logger("game_session_manager")
+def get_user_game_sessions(
+    user_id: str,
+    limit: Optional[int] = None,
+    fields: Optional[Dict[str, Any]] = None,
+) -> List[Dict[str, Any]]:
+    """Fetch sessions for the supplied user, most recently updated first."""
     start_time = time.time()
 
     logger.debug("Retrieving game sessions for user: %s", user_id)
@@ -69,7 +80,7 @@ def get_user_game_sessions(user_id: str) -> List[Dict[str, Any]]:
             logger.error("Cannot get user game sessions - database not connected")
             return []
 
-        sessions = db.get_user_game_sessions(user_id)
+        sessions = db.get_user_game_sessions(user_id, limit=limit, fields=fields)
 
         duration = time.time() - start_time
         StoryOSLogger.log_performance(
@@ -105,9 +116,165 @@ def get_user_game_sessions(user_id: str) -> List[Dict[str, Any]]:
         return []
 
 
+# How long a user's session index is reused before it is rebuilt from MongoDB.
+SESSION_INDEX_TTL_SECONDS = 60.0
+
+# Characters of last_scene shown in the saved-games list. One extra code point is
+# projected so the client can tell the scene was cut and append an ellipsis.
+SESSION_PREVIEW_LENGTH = 200
+
+# Only the fields the saved-games list renders: the latest timeline event and
+# a count instead of the whole timeline, and no storyline or character state.
+SESSION_LIST_PROJECTION: Dict[str, Any] = {
+    "name": 1,
+    "scenario_id": 1,
+    "user_id": 1,
+    "created_at": 1,
+    "last_updated": 1,
+    "turn_count": 1,
+    "game_speed": 1,
+    "timeline": {"$slice": -1},
+    "timeline_count": {"$size": {"$ifNull": ["$timeline", []]}},
+    "last_scene_preview": {
+        "$substrCP": [{"$ifNull": ["$last_scene", ""]}, 0, SESSION_PREVIEW_LENGTH + 1]
+    },
+}
+
+_session_index_cache: Dict[str, Tuple[float, "UserSessionIndex"]] = {}
+_session_index_lock = threading.Lock()
+
+
+@dataclass(frozen=True, slots=True)
+class SessionSummary:
+    """Typed, read-only view of a projected session document for list rendering."""
+
+    id: str
+    scenario_id: str
+    user_id: str
+    name: Optional[str]
+    created_at: Optional[str]
+    last_updated: Optional[str]
+    turn_count: int
+    game_speed: int
+    timeline_count: int
+    last_event: Optional[Dict[str, Any]]
+    last_scene_preview: str
+
+    @classmethod
+    def from_document(cls, document: Dict[str, Any]) -> "SessionSummary":
+        timeline = document.get("timeline") or []
+        return cls(
+            # Stringify the ObjectId once here so readers of the cached index never re-encode it.
+            id=str(document.get("_id", "")),
+            scenario_id=document.get("scenario_id", ""),
+            user_id=document.get("user_id", ""),
+            name=document.get("name"),
+            created_at=document.get("created_at"),
+            last_updated=document.get("last_updated"),
+            turn_count=document.get("turn_count", 0),
+            game_speed=document.get("game_speed", 4),
+            timeline_count=document.get("timeline_count", len(timeline)),
+            last_event=timeline[-1] if timeline else None,
+            last_scene_preview=document.get("last_scene_preview", ""),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Serialise to the list payload the frontend expects."""
+        return {
+            "_id": self.id,
+            "scenario_id": self.scenario_id,
+            "user_id": self.user_id,
+            "name": self.name,
+            "created_at": self.created_at,
+            "last_updated": self.last_updated,
+            "turn_count": self.turn_count,
+            "game_speed": self.game_speed,
+            "timeline_count": self.timeline_count,
+            "timeline": [self.last_event] if self.last_event else [],
+            "last_scene_preview": self.last_scene_preview,
+        }
+
+
+@dataclass(frozen=True)
+class UserSessionIndex:
+    """A user's sessions, most recent first as returned by MongoDB, plus derived lookups."""
+
+    sessions: Tuple[SessionSummary, ...]
+    ids: FrozenSet[str]
+
+    @classmethod
+    def from_sessions(cls, sessions: List[Dict[str, Any]]) -> "UserSessionIndex":
+        ordered = tuple(SessionSummary.from_document(item) for item in sessions)
+        return cls(
+            sessions=ordered,
+            ids=frozenset(summary.id for summary in ordered),
+        )
+
+    @property
+    def count(self) -> int:
+        return len(self.sessions)
+
+    @property
+    def most_recent(self) -> Optional[SessionSummary]:
+        return self.sessions[0] if self.sessions else None
+
+
+def get_user_session_index(user_id: str) -> UserSessionIndex:
+    """Return the cached session index for a user, rebuilding it once the TTL lapses."""
+    now = time.monotonic()
+    with _session_index_lock:
+        cached = _session_index_cache.get(user_id)
+    if cached and now - cached[0] < SESSION_INDEX_TTL_SECONDS:
+        return cached[1]
+
+    index = UserSessionIndex.from_sessions(
+        get_user_game_sessions(user_id, fields=SESSION_LIST_PROJECTION)
+    )
+    with _session_index_lock:
+        _session_index_cache[user_id] = (now, index)
+    return index
+
+
+def invalidate_user_session_index(user_id: str) -> None:
+    """Drop a user's cached session index after their sessions change."""
+    with _session_index_lock:
+        _session_index_cache.pop(user_id, None)
+
+
+def remove_from_user_session_index(user_id: str, session_id: str) -> None:
+    """Drop one session from a user's cached index without refetching the others."""
+    with _session_index_lock:
+        cached = _session_index_cache.get(user_id)
+        if cached is None or session_id not in cached[1].ids:
+            return
+        built_at, index = cached
+        _session_index_cache[user_id] = (
+            built_at,
+            UserSessionIndex(
+                sessions=tuple(summary for summary in index.sessions if summary.id != session_id),
+                ids=index.ids - {session_id},
+            ),
+        )
+
+
+def validate_game_session(user_id: str, session_id: str) -> bool:
+    """Return True when ``session_id`` belongs to ``user_id``.
+
+    A miss is confirmed with a single-document lookup, so sessions created by
+    another worker are accepted without rebuilding the whole index, and unknown
+    IDs don't evict it. The index is only dropped when the lookup finds the
+    session, so the next listing includes it.
+    """
+    if session_id in get_user_session_index(user_id).ids:
+        return True
+    if not get_db_manager().user_owns_game_session(user_id, session_id):
+        return False
+    invalidate_user_session_index(user_id)
+    return True
+
+
 def display_game_session_info(session: GameSession) -> None:
     """Render key session information in the Streamlit sidebar."""
-    logger = get_logger("game_session_manager")
 
     try:
         session_id = session.id or "unknown"
@@ -163,7 +330,6 @@ def display_game_session_info(session: GameSession) -> None:
 
 def export_game_session(session_id: str) -> Optional[str]:
     """Export a session to a JSON string."""
-    logger = get_logger("game_session_manager")
     start_time = time.time()
 
     logger.info("Exporting game session: %s", session_id)
@@ -192,7 +358,7 @@ def export_game_session(session_id: str) -> Optional[str]:
             "chat_history": serialized_history,
         }
 
-        json_export = json.dumps(export_payload, indent=2)
+        json_export = json.dumps(export_payload, indent=2, default=str)
 
         duration = time.time() - start_time
         StoryOSLogger.log_performance(
@@ -265,4 +265,15 @@ class GrokImageClient:
         return None
 
 
-__all__ = ["GrokImageClient"]
+# Global Grok-2-Image client, so visualizations reuse the pooled HTTP session
+_grok_image_client: Optional[GrokImageClient] = None
+
+def get_grok_image_client() -> GrokImageClient:
+    """Get the global Grok-2-Image client instance"""
+    global _grok_image_client
+    if _grok_image_client is None:
+        _grok_image_client = GrokImageClient()
+    return _grok_image_client
+
+
+__all__ = ["GrokImageClient", "get_grok_image_client"]
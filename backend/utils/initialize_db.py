@@ -9,6 +9,12 @@ from backend.logging_config import StoryOSLogger, get_logger
 from backend.utils.db_utils import DatabaseManager
 import os
 
+# Indexes replaced by the compound indexes below; dropped when the replacement is created
+SUPERSEDED_INDEXES = {
+    'active_game_sessions': ['user_id_1_created_at_-1'],
+    'system_prompts': ['active_1'],
+}
+
 def _check_initialization_status(db:DatabaseManager):
     """Check which parts of database initialization are needed"""
     logger = get_logger("initialize_db")
@@ -30,9 +36,9 @@ def _check_initialization_status(db:DatabaseManager):
             required_indexes = {
                 'users': ['user_id_1'],
                 'scenarios': ['scenario_id_1'], 
-                'active_game_sessions': ['user_id_1_created_at_-1'],
+                'active_game_sessions': ['user_id_1_last_updated_-1'],
                 'chats': ['game_session_id_1'],
-                'system_prompts': ['active_1']
+                'system_prompts': ['active_1_name_1']
             }
             
             for collection_name, expected_indexes in required_indexes.items():
@@ -46,6 +52,11 @@ def _check_initialization_status(db:DatabaseManager):
                                 logger.debug(f"Missing index {expected_index} in collection {collection_name}")
                                 status['indexes_needed'] = True
                                 break
+                        
+                        for superseded_index in SUPERSEDED_INDEXES.get(collection_name, []):
+                            if superseded_index in existing_index_names:
+                                logger.debug(f"Superseded index {superseded_index} still present in collection {collection_name}")
+                                status['indexes_needed'] = True
                     except Exception as e:
                         logger.debug(f"Error checking indexes for {collection_name}: {str(e)}")
                         status['indexes_needed'] = True
@@ -63,8 +74,7 @@ def _check_initialization_status(db:DatabaseManager):
             status['system_prompt_needed'] = True
         
         # Check if scenarios exist
-        scenarios = db.get_all_scenarios()
-        if not scenarios:
+        if not db.get_scenario_count():
             logger.debug("No scenarios found")
             status['scenarios_needed'] = True
 
@@ -140,9 +150,9 @@ def initialize_database():
                 if "duplicate key error" not in str(e).lower():
                     logger.warning(f"Could not create scenarios.scenario_id index: {str(e)}")
             
-            # Active game sessions - compound index
+            # Active game sessions - compound index matching the session listing sort
             try:
-                db.db.active_game_sessions.create_index([("user_id", 1), ("created_at", -1)])
+                db.db.active_game_sessions.create_index([("user_id", 1), ("last_updated", -1)])
                 logger.info("Created index on active_game_sessions")
                 initialized_items += 1
             except Exception as e:
@@ -158,14 +168,26 @@ def initialize_database():
                 if "duplicate key error" not in str(e).lower():
                     logger.warning(f"Could not create chats.game_session_id index: {str(e)}")
             
-            # System prompts - index on active flag
+            # System prompts - compound index matching the active prompt lookups by name
             try:
-                db.db.system_prompts.create_index("active")
-                logger.info("Created index on system_prompts.active")
+                db.db.system_prompts.create_index([("active", 1), ("name", 1)])
+                logger.info("Created index on system_prompts")
                 initialized_items += 1
             except Exception as e:
                 if "duplicate key error" not in str(e).lower():
-                    logger.warning(f"Could not create system_prompts.active index: {str(e)}")
+                    logger.warning(f"Could not create system_prompts index: {str(e)}")
+            
+            # Drop the indexes the compound indexes above replaced
+            for collection_name, index_names in SUPERSEDED_INDEXES.items():
+                existing_index_names = db.db[collection_name].index_information()
+                for index_name in index_names:
+                    if index_name not in existing_index_names:
+                        continue
+                    try:
+                        db.db[collection_name].drop_index(index_name)
+                        logger.info(f"Dropped superseded index {index_name} on {collection_name}")
+                    except Exception as e:
+                        logger.warning(f"Could not drop index {collection_name}.{index_name}: {str(e)}")
             
         except Exception as e:
             logger.error(f"Error creating indexes: {str(e)}")
@@ -260,9 +282,7 @@ def initialize_database():
         logger.info("Loading scenarios from file")
         try:
             with open('data/scenario_firstyearuni.md', 'r', encoding='utf-8') as f:
-                scenario_content = f.read()
-
-            scenario = parse_scenario_from_markdown(scenario_content)
+                scenario = parse_scenario_from_markdown(f)
 
             if scenario and db.create_scenario(scenario):
                 logger.info(f"Successfully loaded scenario: {scenario.name} from data/scenario_firstyearuni.md")
@@ -278,8 +298,7 @@ def initialize_database():
                 "operation": "load_scenarios"
             })
     else:
-        scenarios = db.get_all_scenarios()
-        logger.debug(f"Found {len(scenarios)} existing scenarios, skipping scenario loading")
+        logger.debug("Scenarios already exist, skipping scenario loading")
     
     logger.info(f"Database initialization complete! Initialized {initialized_items} items")
     
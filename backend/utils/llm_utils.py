@@ -478,7 +478,7 @@ class LLMUtility:
 
             characters_display: List[str] = []
             if involved_characters:
-                characters_display = [name.strip() for name in involved_characters if name and name.strip()]
+                characters_display = [stripped for name in involved_characters if name and (stripped := name.strip())]
 
             # Attempt to infer characters from JSON response when none provided
             inferred_characters: List[str] = []
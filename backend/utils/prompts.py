@@ -1,3 +1,4 @@
+import logging
 from typing import Dict, List, Any
 from pathlib import Path
 
@@ -5,8 +6,41 @@ from backend.logging_config import get_logger, StoryOSLogger
 from backend.models.game_session_model import GameSession
 from backend.models.message import Message
 from backend.utils.db_utils import get_db_manager
+from backend.utils.scenario_manager import get_cached_scenario
+from backend.utils.system_prompt_manager import (
+    get_active_system_prompt,
+    get_active_visualization_system_prompt,
+)
 from backend.models.story_archetypes import Archetype
 
+logger = get_logger("prompts")
+
+# Fixed storyline guidance paragraphs, built once rather than concatenated on every turn
+_STORYLINE_PROGRESS_INSTRUCTIONS = (
+    "IMPORTANT: Guide your response to advance the story toward achieving the current chapter's goal. "
+    "Introduce elements, challenges, or opportunities that move the narrative forward toward the next chapter. "
+    "Your response should help transition events and circumstances to naturally progress the story toward the next chapter. "
+    "Even if this means changing the setting or introducing new characters or having completely new plotlines burst into the story. "
+    "It's important for the dungeon master (StoryOS) to keep the story moving. "
+    "Make progress visible to the player while maintaining engagement.\n"
+)
+
+_FINAL_CHAPTER_WARNING = (
+    "\n**CRITICAL - FINAL CHAPTER APPROACHING**: The next chapter is the FINAL chapter of this story. "
+    "You MUST begin wrapping up all storylines, resolving character arcs, and moving toward narrative closure. "
+    "Start tying up loose ends and preparing for the story's conclusion. "
+    "This is essential - the story needs to reach a satisfying ending soon. "
+    "Guide events toward resolution and climax.\n"
+)
+
+_ACT_FINALE_WARNING = (
+    "\n**ACT {act} FINALE APPROACHING**: The next chapter is the FINAL chapter of Act {act}. "
+    "You should begin building toward the act's climax and resolution. "
+    "Ensure the main conflicts and goals of Act {act} are being addressed and moving toward closure. "
+    "Set up the transition to the next act while resolving this act's major story threads. "
+    "This is an important turning point in the narrative.\n"
+)
+
 class PromptCreator:
     """Utility class for creating and managing prompts"""
 
@@ -96,25 +130,12 @@ class PromptCreator:
             guidance += f"Next Chapter Goal: {next_chapter_obj.chapter_goal}\n"
             guidance += f"Next Chapter Summary: {next_chapter_obj.chapter_summary}\n\n"
 
-        guidance += "IMPORTANT: Guide your response to advance the story toward achieving the current chapter's goal. "
-        guidance += "Introduce elements, challenges, or opportunities that move the narrative forward toward the next chapter. "
-        guidance += "Your response should help transition events and circumstances to naturally progress the story toward the next chapter. "
-        guidance += "Even if this means changing the setting or introducing new characters or having completely new plotlines burst into the story. "
-        guidance += "It's important for the dungeon master (StoryOS) to keep the story moving. "
-        guidance += "Make progress visible to the player while maintaining engagement.\n"
+        guidance += _STORYLINE_PROGRESS_INSTRUCTIONS
 
         if next_chapter_is_last:
-            guidance += "\n**CRITICAL - FINAL CHAPTER APPROACHING**: The next chapter is the FINAL chapter of this story. "
-            guidance += "You MUST begin wrapping up all storylines, resolving character arcs, and moving toward narrative closure. "
-            guidance += "Start tying up loose ends and preparing for the story's conclusion. "
-            guidance += "This is essential - the story needs to reach a satisfying ending soon. "
-            guidance += "Guide events toward resolution and climax.\n"
+            guidance += _FINAL_CHAPTER_WARNING
         elif next_chapter_is_last_in_act:
-            guidance += f"\n**ACT {current_act} FINALE APPROACHING**: The next chapter is the FINAL chapter of Act {current_act}. "
-            guidance += "You should begin building toward the act's climax and resolution. "
-            guidance += f"Ensure the main conflicts and goals of Act {current_act} are being addressed and moving toward closure. "
-            guidance += "Set up the transition to the next act while resolving this act's major story threads. "
-            guidance += "This is an important turning point in the narrative.\n"
+            guidance += _ACT_FINALE_WARNING.format(act=current_act)
 
         logger.info(f"Added storyline guidance for Act {current_act}, Chapter {current_chapter} (turn {turn_count})")
         return guidance
@@ -129,7 +150,6 @@ class PromptCreator:
         Returns:
             The content of the prompt file as a string
         """
-        logger = get_logger("prompts")
         prompt_file_path = Path(__file__).parent.parent / "config" / "prompts" / filename
         
         try:
@@ -146,9 +166,7 @@ class PromptCreator:
     
     @staticmethod
     def create_scenario_system_prompt() -> str:
-        logger = get_logger("prompts")
-        db=get_db_manager()
-        active_sys_prompt_obj = db.get_active_system_prompt()        
+        active_sys_prompt_obj = get_active_system_prompt()
         try:
             if not active_sys_prompt_obj or 'content' not in active_sys_prompt_obj: 
                 raise ValueError("No active system prompt found in the database.")
@@ -166,7 +184,6 @@ class PromptCreator:
     @staticmethod
     def create_custom_system_prompt(user_input: str, scenario_summary: str, scenario_instructions: str) -> str:
         """Create a custom system prompt based on user input"""
-        logger = get_logger("prompts")
         try:
             if not user_input or not isinstance(user_input, str):
                 raise ValueError("User input must be a non-empty string.")
@@ -202,10 +219,11 @@ class PromptCreator:
         Returns:
             List of messages formatted for LLM API
         """
-        logger = get_logger("prompts")
         session_id = game_session.id
+        # Checked once; the timeline and message loops below run on every turn
+        debug_enabled = logger.isEnabledFor(logging.DEBUG)
         
-        logger.debug(f"Constructing game prompt for session: {session_id} with {len(recent_messages)} recent messages")
+        logger.debug("Constructing game prompt for session: %s with %d recent messages", session_id, len(recent_messages))
         
         messages: List[Message] = []
 
@@ -214,8 +232,7 @@ class PromptCreator:
         context += "=== SCENARIO RULES ===\n"
 
         scenario_id = game_session.scenario_id
-        db = get_db_manager()
-        scenario_obj = db.get_scenario(scenario_id) if scenario_id else None
+        scenario_obj = get_cached_scenario(scenario_id) if scenario_id else None
 
         # TODO: add validation for these fields earlier on, and if these are not found then fail the whole app instead of using default values
         scenario_desc = scenario_obj.description if scenario_obj else 'No scenario description available.'
@@ -262,11 +279,12 @@ class PromptCreator:
 
                 story_summary = " - ".join(summary_parts)
                 story_path_summaries.append(story_summary)
-                logger.debug(
-                    "Timeline summary added (%s): %s",
-                    idx,
-                    story_summary[:120] + ("..." if len(story_summary) > 120 else ""),
-                )
+                if debug_enabled:
+                    logger.debug(
+                        "Timeline summary added (%s): %s",
+                        idx,
+                        story_summary[:120] + ("..." if len(story_summary) > 120 else ""),
+                    )
 
 
 
@@ -274,15 +292,14 @@ class PromptCreator:
             context += "\n=== CURRENT GAME STATE ===\n"
             if world_state:
                 context += f"World State: {world_state}\n"
-                logger.debug(f"World state added (length: {len(world_state)})")
+                logger.debug("World state added (length: %d)", len(world_state))
             if last_scene:
                 context += f"Last Scene: {last_scene}\n"
-                logger.debug(f"Last Scene added (length: {len(last_scene)})")
+                logger.debug("Last Scene added (length: %d)", len(last_scene))
             if story_path_summaries:
                 context += "The Story So Far:\n"
-                for summary in story_path_summaries:
-                    context += f"- {summary}\n"
-                logger.debug(f"Added {len(story_path_summaries)} timeline summaries to context")
+                context += "".join(f"- {summary}\n" for summary in story_path_summaries)
+                logger.debug("Added %d timeline summaries to context", len(story_path_summaries))
         
             # Add character summaries if any
             if character_summaries:
@@ -290,12 +307,12 @@ class PromptCreator:
                 for char_name, char_data in character_summaries.items():
                     char_story = char_data.character_story
                     context += f"{char_name}: {char_story}\n"
-                    logger.debug(f"Character summary added - {char_name} (length: {len(char_story)})")
+                    logger.debug("Character summary added - %s (length: %d)", char_name, len(char_story))
         
         storyline_guidance = ""
         if should_add_guidance:
             storyline_guidance = PromptCreator._build_storyline_guidance(game_session, logger)
-            logger.debug(f"Storyline guidance triggered at turn {turn_count} (game_speed={game_speed}, frequency={guidance_frequency})")
+            logger.debug("Storyline guidance triggered at turn %s (game_speed=%s, frequency=%s)", turn_count, game_speed, guidance_frequency)
         
         # Add storyline guidance to context if applicable
         if storyline_guidance:
@@ -311,7 +328,7 @@ class PromptCreator:
                 role="system",
             )
         )
-        logger.debug(f"Game state context added (total length: {len(context)})")
+        logger.debug("Game state context added (total length: %d)", len(context))
 
         # Add recent conversation history (last 4 messages)
         recent_slice = recent_messages[-4:]
@@ -331,7 +348,7 @@ class PromptCreator:
                 )
             )
             message_count += 1
-            logger.debug(f"Added recent message {message_count}: {role} (length: {len(content)})")
+            logger.debug("Added recent message %d: %s (length: %d)", message_count, role, len(content))
         
         total_prompt_length = sum(len(msg.content or "") for msg in messages)
         logger.info(f"Game prompt constructed - {len(messages)} messages, {total_prompt_length} total chars")
@@ -341,11 +358,8 @@ class PromptCreator:
     @staticmethod
     def build_visualization_prompt(session: GameSession, complete_response: str) -> List[Message]:
         """Load the visualization system prompt and pair it with session context."""
-        logger = get_logger("prompts")
-
         try:
-            db = get_db_manager()
-            system_prompt = db.get_active_visualization_system_prompt()
+            system_prompt = get_active_visualization_system_prompt()
         except Exception as exc:
             logger.error("Unable to retrieve visualization system prompt: %s", str(exc))
             raise
@@ -375,8 +389,6 @@ class PromptCreator:
     @staticmethod
     def generate_initial_story_prompt(session_id: str) -> List[Message]:
 
-        logger = get_logger("prompts")
-        
         logger.info(f"Generating initial story message for session: {session_id}")
         
         db = get_db_manager()
@@ -392,7 +404,7 @@ class PromptCreator:
             logger.error(f"No scenario_id found in session for session_id: {session_id}")
             raise ValueError(f"No scenario_id found in session for session_id: {session_id}")
         
-        scenario = db.get_scenario(scenario_id)
+        scenario = get_cached_scenario(scenario_id)
         if scenario is None:
             logger.error(f"No scenario found for scenario_id: {scenario_id}")
             raise ValueError(f"No scenario found for scenario_id: {scenario_id}")
@@ -448,7 +460,6 @@ Generate an immersive opening that brings the player into this world and ends wi
         complete_response: str,
     ) -> List[Message]:
         """Construct a detailed prompt summarizing the game session"""
-        logger = get_logger("prompts")
         session_id = current_game_session.id
         
         logger.debug(f"Constructing game session prompt for session: {session_id}")
@@ -567,8 +578,6 @@ Generate an immersive opening that brings the player into this world and ends wi
     @staticmethod
     def build_storyline_creation_prompt(archetype: Archetype, scenario_storyline_description: str) -> List[Message]:
         """Build a prompt to create a new scenario based on the selected archetype and user description."""
-        logger = get_logger("prompts")
-        
         # Load the story architect system prompt from file
         system_prompt = PromptCreator._load_prompt_from_file("story_architect_system_prompt.md")
         
@@ -0,0 +1,109 @@
+"""Scenario helper utilities for StoryOS."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from backend.logging_config import get_logger
+from backend.models.scenario import Scenario
+from backend.utils.db_utils import get_db_manager
+
+logger = get_logger("scenario_manager")
+
+# How long a scenario listing is reused before it is re-read from MongoDB.
+SCENARIO_LIST_TTL_SECONDS = 60.0
+
+SCENARIO_SUMMARY_FIELDS = ("scenario_id", "name", "description", "author", "visibility", "version")
+
+# Both keyed by the visibility scope passed to the DB query (None = every scenario).
+_scenario_list_cache: Dict[Optional[str], Tuple[float, Tuple[Scenario, ...]]] = {}
+_scenario_summary_cache: Dict[Optional[str], Tuple[float, Tuple[Dict[str, Any], ...]]] = {}
+# Single scenarios by scenario_id, read on every story turn when building prompts
+_scenario_cache: Dict[str, Tuple[float, Scenario]] = {}
+_scenario_list_lock = threading.Lock()
+
+
+def _get_cached(
+    cache: Dict[Optional[str], Tuple[float, Tuple[Any, ...]]],
+    user_id: Optional[str],
+    load: Callable[[Optional[str]], List[Any]],
+) -> Tuple[Any, ...]:
+    now = time.monotonic()
+    with _scenario_list_lock:
+        cached = cache.get(user_id)
+    if cached and now - cached[0] < SCENARIO_LIST_TTL_SECONDS:
+        return cached[1]
+
+    logger.debug("Scenario cache miss for user: %s", user_id)
+    items = tuple(load(user_id))
+    with _scenario_list_lock:
+        cache[user_id] = (now, items)
+    return items
+
+
+def _load_scenarios(user_id: Optional[str]) -> List[Scenario]:
+    return get_db_manager().get_all_scenarios(user_id=user_id)
+
+
+def _load_scenario_summaries(user_id: Optional[str]) -> List[Dict[str, Any]]:
+    summaries = get_db_manager().get_scenario_summaries(list(SCENARIO_SUMMARY_FIELDS), user_id=user_id)
+    # Full listings skip documents that don't validate as a Scenario; do the same for
+    # summaries missing a field the listing needs
+    return [summary for summary in summaries if all(field in summary for field in SCENARIO_SUMMARY_FIELDS)]
+
+
+def get_visible_scenarios(user_id: Optional[str] = None) -> List[Scenario]:
+    """Return the scenarios visible to ``user_id``, served from a short-lived cache.
+
+    ``user_id=None`` lists every scenario, matching ``DatabaseManager.get_all_scenarios``.
+    """
+    return list(_get_cached(_scenario_list_cache, user_id, _load_scenarios))
+
+
+def get_visible_scenario_summaries(user_id: Optional[str] = None) -> List[Dict[str, Any]]:
+    """Return the cached list summaries for the scenarios visible to ``user_id``.
+
+    Only the summary fields are read from MongoDB, so prompts and storylines stay server-side.
+    """
+    return list(_get_cached(_scenario_summary_cache, user_id, _load_scenario_summaries))
+
+
+def get_cached_scenario(scenario_id: str) -> Optional[Scenario]:
+    """Return a scenario by id, reusing it for ``SCENARIO_LIST_TTL_SECONDS``.
+
+    The returned model is shared between callers and must not be mutated.
+    """
+    now = time.monotonic()
+    with _scenario_list_lock:
+        cached = _scenario_cache.get(scenario_id)
+    if cached and now - cached[0] < SCENARIO_LIST_TTL_SECONDS:
+        return cached[1]
+
+    scenario = get_db_manager().get_scenario(scenario_id)
+    if scenario is not None:
+        with _scenario_list_lock:
+            _scenario_cache[scenario_id] = (now, scenario)
+    return scenario
+
+
+def invalidate_scenario_cache(*scenarios: Scenario) -> None:
+    """Drop the cached copies of the given scenarios and the listings that can contain them.
+
+    Private scenarios are only listed for their author and for admins, so other
+    users keep their cached listing. With no scenarios, or any public one,
+    every listing is dropped.
+    """
+    with _scenario_list_lock:
+        if not scenarios:
+            _scenario_cache.clear()
+        for scenario in scenarios:
+            _scenario_cache.pop(scenario.scenario_id, None)
+        for cache in (_scenario_list_cache, _scenario_summary_cache):
+            if not scenarios or any(scenario.visibility == "public" for scenario in scenarios):
+                cache.clear()
+                continue
+            cache.pop(None, None)
+            for scenario in scenarios:
+                cache.pop(scenario.author, None)
@@ -5,15 +5,16 @@ from __future__ import annotations
 import re
 import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Union
 
 from backend.logging_config import get_logger, StoryOSLogger
 from backend.models.scenario import Scenario
 
+logger = get_logger("scenario_parser")
+
 
 def validate_scenario_data(scenario_data: Dict[str, Any]) -> List[str]:
     """Validate scenario metadata and return a list of issues."""
-    logger = get_logger("scenario_parser")
     start_time = time.time()
 
     scenario_id = scenario_data.get("scenario_id", "unknown")
@@ -88,8 +89,6 @@ def validate_scenario_data(scenario_data: Dict[str, Any]) -> List[str]:
 
 def is_valid_semver(version: str) -> bool:
     """Return True if the version string matches semantic versioning (MAJOR.MINOR.PATCH)."""
-    logger = get_logger("scenario_parser")
-
     try:
         pattern = r"^[0-9]+\.[0-9]+\.[0-9]+$"
         is_valid = bool(re.match(pattern, version))
@@ -101,25 +100,26 @@ def is_valid_semver(version: str) -> bool:
         return False
 
 
-def parse_scenario_from_markdown(markdown_content: str) -> Optional[Scenario]:
-    """Parse a scenario definition from markdown content."""
-    logger = get_logger("scenario_parser")
+def parse_scenario_from_markdown(markdown_content: Union[str, Iterable[str]]) -> Optional[Scenario]:
+    """Parse a scenario definition from markdown content.
+
+    Accepts the markdown as a string or as an iterable of lines, such as an open
+    file, so callers don't need to read the whole file into memory first.
+    """
     start_time = time.time()
 
-    content_length = len(markdown_content)
-    logger.debug(
-        "Parsing scenario from markdown (length: %s chars)",
-        content_length,
-    )
+    content_length = 0
+    logger.debug("Parsing scenario from markdown")
 
     try:
-        lines = markdown_content.splitlines()
+        lines = markdown_content.splitlines() if isinstance(markdown_content, str) else markdown_content
         scenario_data: Dict[str, Any] = {}
         current_section: str | None = None
         current_content: List[str] = []
         sections_processed = 0
 
         for raw_line in lines:
+            content_length += len(raw_line)
             line = raw_line.strip()
             if not line or line.startswith("<!--"):
                 continue
@@ -200,8 +200,6 @@ def parse_scenario_from_markdown(markdown_content: str) -> Optional[Scenario]:
 
 def process_section(scenario_data: Dict[str, Any], section: str, content: List[str]) -> None:
     """Update ``scenario_data`` with the contents of a parsed section."""
-    logger = get_logger("scenario_parser")
-
     try:
         content_text = "\n".join(content).strip()
         logger.debug(
@@ -12,6 +12,7 @@ from backend.models.message import Message
 from backend.utils.db_utils import DatabaseManager
 from backend.utils.llm_utils import LLMUtility
 from backend.utils.prompts import PromptCreator
+from backend.utils.system_prompt_manager import get_active_system_prompt
 
 
 def prepare_game_context(
@@ -21,7 +22,7 @@ def prepare_game_context(
     logger: logging.Logger,
 ) -> tuple[List[Message], str]:
     """Build the message stack required for the LLM call."""
-    system_prompt_doc = db.get_active_system_prompt()
+    system_prompt_doc = get_active_system_prompt(db)
     if not system_prompt_doc:
         logger.error("No active system prompt found")
         return [], "System configuration error"
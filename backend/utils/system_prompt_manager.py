@@ -0,0 +1,57 @@
+"""System prompt helper utilities for StoryOS."""
+
+from __future__ import annotations
+
+import threading
+import time
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from backend.logging_config import get_logger
+from backend.utils.db_utils import DatabaseManager, get_db_manager
+
+logger = get_logger("system_prompt_manager")
+
+# How long an active system prompt is reused before it is re-read from MongoDB.
+SYSTEM_PROMPT_TTL_SECONDS = 60.0
+
+_STORY_PROMPT_KEY = "story"
+_VISUALIZATION_PROMPT_KEY = "visualization"
+
+_system_prompt_cache: Dict[str, Tuple[float, Any]] = {}
+_system_prompt_lock = threading.Lock()
+
+
+def _get_cached(key: str, load: Callable[[], Any]) -> Any:
+    now = time.monotonic()
+    with _system_prompt_lock:
+        cached = _system_prompt_cache.get(key)
+    if cached and now - cached[0] < SYSTEM_PROMPT_TTL_SECONDS:
+        return cached[1]
+
+    logger.debug("System prompt cache miss: %s", key)
+    # Lookups raise when the prompt is missing; nothing is cached in that case
+    value = load()
+    with _system_prompt_lock:
+        _system_prompt_cache[key] = (now, value)
+    return value
+
+
+def get_active_system_prompt(db_manager: Optional[DatabaseManager] = None) -> Dict[str, Any]:
+    """Return the active story system prompt document, served from a short-lived cache.
+
+    A copy is returned so callers can't change the cached document.
+    """
+    db = db_manager if db_manager is not None else get_db_manager()
+    return dict(_get_cached(_STORY_PROMPT_KEY, db.get_active_system_prompt))
+
+
+def get_active_visualization_system_prompt(db_manager: Optional[DatabaseManager] = None) -> str:
+    """Return the active visualization system prompt content, served from a short-lived cache."""
+    db = db_manager if db_manager is not None else get_db_manager()
+    return _get_cached(_VISUALIZATION_PROMPT_KEY, db.get_active_visualization_system_prompt)
+
+
+def invalidate_system_prompt_cache() -> None:
+    """Drop the cached prompts so the next lookup reads the stored versions."""
+    with _system_prompt_lock:
+        _system_prompt_cache.clear()
@@ -0,0 +1,13 @@
+"""Timestamp helpers shared by the models and database actions."""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+
+def utcnow() -> datetime:
+    """Current UTC time as a naive datetime, matching the stored ISO timestamps.
+
+    Replaces the deprecated ``datetime.utcnow()`` without changing the stored format.
+    """
+    return datetime.now(timezone.utc).replace(tzinfo=None)
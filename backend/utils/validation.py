@@ -61,9 +61,7 @@ class DataValidator:
         """Validate that scenarios exist in the database"""
         try:
             db = get_db_manager()
-            scenarios = db.get_all_scenarios()
-            
-            scenario_count = len(scenarios) if scenarios else 0
+            scenario_count = db.get_scenario_count()
             
             if scenario_count > 0:
                 self.logger.debug(f"Found {scenario_count} scenarios in database")
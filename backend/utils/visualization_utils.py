@@ -9,7 +9,7 @@ from backend.logging_config import StoryOSLogger, get_logger
 from backend.models.image_prompts import VisualPrompts
 from backend.models.visualization_response import VisualizationResponse
 from backend.utils.db_utils import get_db_manager
-from backend.utils.grok2image_client import GrokImageClient
+from backend.utils.grok2image_client import get_grok_image_client
 from backend.utils.llm_utils import get_llm_utility
 from backend.utils.model_utils import ModelUtils
 from backend.utils.prompts import PromptCreator
@@ -23,15 +23,15 @@ class VisualizationManager:
     @staticmethod
     def submit_prompt(prompt: str, session_id: str, message_id: str) -> VisualizationResponse:
         """Submit an image prompt and return the Grok-2-Image response payload."""
-        if not prompt or not prompt.strip():
+        cleaned_prompt = prompt.strip() if prompt else ""
+        if not cleaned_prompt:
             raise ValueError("Prompt is required for visualization requests.")
 
-        cleaned_prompt = prompt.strip()
         VisualizationManager._logger.debug(
             "Submitting visualization prompt (length=%s)", len(cleaned_prompt)
         )
 
-        client = GrokImageClient()
+        client = get_grok_image_client()
         response_obj: object = client.generate_image_from_prompt(cleaned_prompt, session_id=session_id, message_id=message_id)
 
         if not isinstance(response_obj, VisualizationResponse):
@@ -51,6 +51,7 @@ export const gameAPI = {
 
 export const scenarioAPI = {
   list: () => apiClient.get('/scenarios/'),
+  listSummaries: () => apiClient.get('/scenarios/summaries'),
   get: (scenarioId: string) => apiClient.get(`/scenarios/${scenarioId}`),
   update: (scenarioId: string, data: Record<string, any>) =>
     apiClient.put(`/scenarios/${scenarioId}`, data),
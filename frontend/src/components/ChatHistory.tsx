@@ -16,11 +16,6 @@ interface ChatHistoryProps {
 const preprocessMarkdown = (content: string): string => {
   if (!content) return content;
 
-  // Debug: log first 200 chars and check for newlines
-  console.log('Content preview:', content.substring(0, 200));
-  console.log('Has newlines:', content.includes('\n'));
-  console.log('Has escaped newlines:', content.includes('\\n'));
-
   // Replace escaped newlines if they exist
   let processed = content.replace(/\\n/g, '\n');
 
@@ -30,6 +25,141 @@ const preprocessMarkdown = (content: string): string => {
   return processed;
 };
 
+// Completed messages keep the same content while a new story streams in, so memoising
+// the markdown render stops every chunk from re-parsing the whole chat history
+const MarkdownContent = React.memo(({ content }: { content: string }) => (
+  <ReactMarkdown remarkPlugins={[remarkGfm]}>
+    {preprocessMarkdown(content)}
+  </ReactMarkdown>
+));
+
+// Keeps its own timer so each progress tick re-renders just this bar, not the whole chat
+const VisualizationProgress: React.FC = () => {
+  const [progress, setProgress] = useState(0);
+
+  useEffect(() => {
+    const startTime = Date.now();
+    const duration = 45000; // 45 seconds
+    const maxProgress = 95; // Stop at 95% if not complete
+    let timer: ReturnType<typeof setTimeout> | undefined;
+
+    const updateProgress = () => {
+      const elapsed = Date.now() - startTime;
+      const nextProgress = Math.min((elapsed / duration) * 100, maxProgress);
+
+      setProgress(nextProgress);
+
+      if (nextProgress < maxProgress) {
+        timer = setTimeout(updateProgress, 100);
+      }
+    };
+
+    updateProgress();
+
+    return () => clearTimeout(timer);
+  }, []);
+
+  return (
+    <div className="visualization-progress-container">
+      <div className="visualization-progress-bar">
+        <div
+          className="visualization-progress-fill"
+          style={{ width: `${progress}%` }}
+        />
+      </div>
+      <div className="visualization-progress-text">
+        Generating... {Math.round(progress)}%
+      </div>
+    </div>
+  );
+};
+
+interface ChatBubbleProps {
+  message: Message;
+  onVisualize?: (messageId: string, prompt: string) => void;
+  visualizingKey?: string | null;
+  visualizationError?: string | null;
+  onViewPrompt: (prompt: string) => void;
+}
+
+// Settled messages get the same props on every chunk or progress update, so memoising the
+// bubble skips re-rendering the whole history; only the bubble being visualized changes
+const ChatBubble = React.memo(({
+  message,
+  onVisualize,
+  visualizingKey,
+  visualizationError,
+  onViewPrompt,
+}: ChatBubbleProps) => (
+  <div className={`chat-bubble ${message.sender === 'player' ? 'player' : 'story'}`}>
+    {message.sender === 'StoryOS' ? (
+      <MarkdownContent content={message.content} />
+    ) : (
+      <div>{message.content}</div>
+    )}
+    <div className="timestamp">{new Date(message.timestamp).toLocaleTimeString()}</div>
+    {message.visualPrompts && Object.keys(message.visualPrompts).length > 0 && (
+      <div className="visualization-action-row">
+        {Object.entries(message.visualPrompts).map(([prompt, imageUrl], index) => {
+          const key = `${message.messageId ?? 'message'}:${prompt}`;
+          const isGenerating = visualizingKey === key;
+          const label = `Visualize ${index + 1}`;
+          const hasError = visualizationError && isGenerating;
+
+          return imageUrl ? (
+            <div key={key} className="visualization-item">
+              <a
+                href={imageUrl}
+                target="_blank"
+                rel="noopener noreferrer"
+                className="visualization-thumb"
+              >
+                <img src={imageUrl} alt={prompt} className="visualization-image" />
+              </a>
+              <button
+                type="button"
+                className="prompt-view-button"
+                onClick={() => onViewPrompt(prompt)}
+                title="View prompt"
+              >
+                P
+              </button>
+            </div>
+          ) : (
+            <div key={key} className="visualization-item">
+              <div className="visualization-button-container">
+                {onVisualize && message.messageId && !isGenerating && (
+                  <button
+                    type="button"
+                    className="visualization-button"
+                    onClick={() => onVisualize(message.messageId!, prompt)}
+                  >
+                    {label}
+                  </button>
+                )}
+                {isGenerating && hasError && (
+                  <div className="visualization-error">
+                    Visualization failed
+                  </div>
+                )}
+                {isGenerating && !hasError && <VisualizationProgress />}
+              </div>
+              <button
+                type="button"
+                className="prompt-view-button"
+                onClick={() => onViewPrompt(prompt)}
+                title="View prompt"
+              >
+                P
+              </button>
+            </div>
+          );
+        })}
+      </div>
+    )}
+  </div>
+);
+
 const ChatHistory: React.FC<ChatHistoryProps> = ({
   messages,
   streamingContent,
@@ -39,8 +169,6 @@ const ChatHistory: React.FC<ChatHistoryProps> = ({
 }) => {
   const bottomRef = useRef<HTMLDivElement | null>(null);
   const hasScrolledRef = useRef(false);
-  const [progressMap, setProgressMap] = useState<Record<string, number>>({});
-  const progressTimersRef = useRef<Record<string, number>>({});
   const [modalPrompt, setModalPrompt] = useState<string | null>(null);
   const chatLogRef = useRef<HTMLDivElement | null>(null);
   const [playerScrollIndicators, setPlayerScrollIndicators] = useState<Array<{ top: number; height: number }>>([]);
@@ -56,50 +184,6 @@ const ChatHistory: React.FC<ChatHistoryProps> = ({
     }
   }, [messages]);
 
-  // Handle progress bar animation
-  useEffect(() => {
-    if (visualizingKey) {
-      // Start progress animation for this key
-      const startTime = Date.now();
-      const duration = 45000; // 45 seconds
-      const maxProgress = 95; // Stop at 95% if not complete
-
-      const updateProgress = () => {
-        const elapsed = Date.now() - startTime;
-        const progress = Math.min((elapsed / duration) * 100, maxProgress);
-
-        setProgressMap((prev) => ({ ...prev, [visualizingKey]: progress }));
-
-        if (progress < maxProgress) {
-          progressTimersRef.current[visualizingKey] = setTimeout(updateProgress, 100);
-        }
-      };
-
-      updateProgress();
-
-      return () => {
-        if (progressTimersRef.current[visualizingKey]) {
-          clearTimeout(progressTimersRef.current[visualizingKey]);
-          delete progressTimersRef.current[visualizingKey];
-        }
-      };
-    }
-  }, [visualizingKey]);
-
-  // Clean up progress when visualization completes
-  useEffect(() => {
-    // Remove progress for keys that are no longer generating
-    setProgressMap((prev) => {
-      const newMap = { ...prev };
-      Object.keys(newMap).forEach((key) => {
-        if (key !== visualizingKey) {
-          delete newMap[key];
-        }
-      });
-      return newMap;
-    });
-  }, [visualizingKey]);
-
   // Calculate scroll indicator positions and sizes for player and story messages
   useEffect(() => {
     if (!chatLogRef.current) return;
@@ -177,98 +261,24 @@ const ChatHistory: React.FC<ChatHistoryProps> = ({
     <>
       <div className="chat-log-wrapper">
         <div className="chat-log" ref={chatLogRef}>
-          {messages.map((message) => (
-        <div
-          key={message.messageId ?? `${message.timestamp}-${message.sender}`}
-          className={`chat-bubble ${message.sender === 'player' ? 'player' : 'story'}`}
-        >
-          {message.sender === 'StoryOS' ? (
-            <ReactMarkdown remarkPlugins={[remarkGfm]}>
-              {preprocessMarkdown(message.content)}
-            </ReactMarkdown>
-          ) : (
-            <div>{message.content}</div>
-          )}
-          <div className="timestamp">{new Date(message.timestamp).toLocaleTimeString()}</div>
-          {message.visualPrompts && Object.keys(message.visualPrompts).length > 0 && (
-            <div className="visualization-action-row">
-              {Object.entries(message.visualPrompts).map(([prompt, imageUrl], index) => {
-                const key = `${message.messageId ?? 'message'}:${prompt}`;
-                const isGenerating = visualizingKey === key;
-                const progress = progressMap[key] || 0;
-                const label = `Visualize ${index + 1}`;
-                const hasError = visualizationError && isGenerating;
-
-                return imageUrl ? (
-                  <div key={key} className="visualization-item">
-                    <a
-                      href={imageUrl}
-                      target="_blank"
-                      rel="noopener noreferrer"
-                      className="visualization-thumb"
-                    >
-                      <img src={imageUrl} alt={prompt} className="visualization-image" />
-                    </a>
-                    <button
-                      type="button"
-                      className="prompt-view-button"
-                      onClick={() => setModalPrompt(prompt)}
-                      title="View prompt"
-                    >
-                      P
-                    </button>
-                  </div>
-                ) : (
-                  <div key={key} className="visualization-item">
-                    <div className="visualization-button-container">
-                      {onVisualize && message.messageId && !isGenerating && (
-                        <button
-                          type="button"
-                          className="visualization-button"
-                          onClick={() => onVisualize(message.messageId!, prompt)}
-                        >
-                          {label}
-                        </button>
-                      )}
-                      {isGenerating && hasError && (
-                        <div className="visualization-error">
-                          Visualization failed
-                        </div>
-                      )}
-                      {isGenerating && !hasError && (
-                        <div className="visualization-progress-container">
-                          <div className="visualization-progress-bar">
-                            <div
-                              className="visualization-progress-fill"
-                              style={{ width: `${progress}%` }}
-                            />
-                          </div>
-                          <div className="visualization-progress-text">
-                            Generating... {Math.round(progress)}%
-                          </div>
-                        </div>
-                      )}
-                    </div>
-                    <button
-                      type="button"
-                      className="prompt-view-button"
-                      onClick={() => setModalPrompt(prompt)}
-                      title="View prompt"
-                    >
-                      P
-                    </button>
-                  </div>
-                );
-              })}
-            </div>
-          )}
-        </div>
-        ))}
+          {messages.map((message) => {
+            const ownsVisualization = Boolean(
+              visualizingKey && message.messageId && visualizingKey.startsWith(`${message.messageId}:`)
+            );
+            return (
+              <ChatBubble
+                key={message.messageId ?? `${message.timestamp}-${message.sender}`}
+                message={message}
+                onVisualize={onVisualize}
+                visualizingKey={ownsVisualization ? visualizingKey : null}
+                visualizationError={ownsVisualization ? visualizationError : null}
+                onViewPrompt={setModalPrompt}
+              />
+            );
+          })}
         {streamingContent && (
           <div className="chat-bubble story">
-            <ReactMarkdown remarkPlugins={[remarkGfm]}>
-              {preprocessMarkdown(streamingContent)}
-            </ReactMarkdown>
+            <MarkdownContent content={streamingContent} />
             <div className="timestamp">streaming…</div>
           </div>
         )}
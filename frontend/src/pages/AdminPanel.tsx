@@ -23,6 +23,12 @@ interface SystemPrompt {
   prompt_type?: string;
 }
 
+// Typing in a prompt editor re-renders the whole panel on every keystroke; memoising the
+// rendered prompts keeps those updates from re-parsing multi-KB markdown each time
+const PromptMarkdown = React.memo(({ content }: { content: string }) => (
+  <ReactMarkdown>{content}</ReactMarkdown>
+));
+
 const AdminPanel: React.FC = () => {
   const [stats, setStats] = useState<AdminStats | null>(null);
   const [pendingUsers, setPendingUsers] = useState<PendingUser[]>([]);
@@ -61,8 +67,8 @@ const AdminPanel: React.FC = () => {
     try {
       await adminAPI.updateUserRole(userId, newRole);
       setSuccessMessage(`User ${userId} has been approved as ${newRole}`);
-      // Refresh data
-      await fetchData();
+      // Only the pending list changes; stats and system prompts stay as loaded
+      setPendingUsers((users) => users.filter((user) => user.user_id !== userId));
     } catch (err: any) {
       setError(err?.response?.data?.detail || 'Failed to update user role');
       console.error(err);
@@ -249,7 +255,7 @@ const AdminPanel: React.FC = () => {
                     maxHeight: '400px',
                     overflowY: 'auto'
                   }}>
-                    <ReactMarkdown>{storyPrompt.content}</ReactMarkdown>
+                    <PromptMarkdown content={storyPrompt.content} />
                   </div>
                 )}
               </div>
@@ -315,7 +321,7 @@ const AdminPanel: React.FC = () => {
                     maxHeight: '400px',
                     overflowY: 'auto'
                   }}>
-                    <ReactMarkdown>{visualizationPrompt.content}</ReactMarkdown>
+                    <PromptMarkdown content={visualizationPrompt.content} />
                   </div>
                 )}
               </div>
@@ -237,7 +237,8 @@ const Game: React.FC = () => {
     wsRef.current?.sendPlayerInput(content);
   };
 
-  const handleVisualize = async (messageId: string, prompt: string) => {
+  // Stable across renders so memoised chat bubbles don't re-render when Game does
+  const handleVisualize = useCallback(async (messageId: string, prompt: string) => {
     if (!sessionId) return;
 
     setVisualizationError(null);
@@ -245,8 +246,20 @@ const Game: React.FC = () => {
     setVisualizingKey(key);
 
     try {
-      await gameAPI.visualizePrompt(sessionId, messageId, prompt);
-      await loadSession();
+      const response = await gameAPI.visualizePrompt(sessionId, messageId, prompt);
+      const imageUrl = response.data?.image_url;
+      if (imageUrl) {
+        // The new image is the only change, so patch it in instead of reloading the whole chat
+        setMessages((prev) =>
+          prev.map((message) =>
+            message.messageId === messageId
+              ? { ...message, visualPrompts: { ...message.visualPrompts, [prompt]: imageUrl } }
+              : message
+          )
+        );
+      } else {
+        await loadSession();
+      }
     } catch (error) {
       console.error('Visualization request failed', error);
       const detail = (error as any)?.response?.data?.detail;
@@ -256,7 +269,7 @@ const Game: React.FC = () => {
     } finally {
       setVisualizingKey(null);
     }
-  };
+  }, [sessionId, loadSession]);
 
   const handleGameSpeedChange = async (newSpeed: number) => {
     if (!sessionId) return;
@@ -5,6 +5,12 @@ import { useAuth } from '../hooks/useAuth';
 import { GameSessionSummary } from '../types';
 import LoadingIndicator from '../components/LoadingIndicator';
 
+// Matches SESSION_PREVIEW_LENGTH in the backend session list projection
+const SESSION_PREVIEW_LENGTH = 200;
+
+const formatScenePreview = (preview: string): string =>
+  preview.length > SESSION_PREVIEW_LENGTH ? `${preview.slice(0, SESSION_PREVIEW_LENGTH)}…` : preview;
+
 const LoadGame: React.FC = () => {
   const navigate = useNavigate();
   const { token } = useAuth();
@@ -85,7 +91,11 @@ const LoadGame: React.FC = () => {
                 <h3>{session.name ?? session.scenario_id}</h3>
                 <p style={{ opacity: 0.7 }}>
                   {lastEvent ? lastEvent.event_title : `Scenario: ${session.scenario_id}`}
+                  {session.timeline_count ? ` · ${session.timeline_count} events` : ''}
                 </p>
+                {session.last_scene_preview && (
+                  <p style={{ opacity: 0.6 }}>{formatScenePreview(session.last_scene_preview)}</p>
+                )}
                 <p style={{ opacity: 0.6 }}>
                   Last updated:{' '}
                   {session.last_updated
@@ -13,7 +13,7 @@ const NewGame: React.FC = () => {
   useEffect(() => {
     const fetchScenarios = async () => {
       try {
-        const response = await scenarioAPI.list();
+        const response = await scenarioAPI.listSummaries();
         setScenarios(response.data ?? []);
       } catch (err) {
         setError('Failed to load scenarios');
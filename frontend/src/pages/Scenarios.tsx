@@ -24,11 +24,13 @@ const Scenarios: React.FC = () => {
     const fetchScenarios = async () => {
       setIsLoading(true);
       try {
-        const response = await scenarioAPI.list();
+        // The sidebar only needs names; full details are loaded for the selected scenario
+        const response = await scenarioAPI.listSummaries();
         const items = Array.isArray(response.data) ? response.data : [];
         setScenarios(items);
         if (items.length > 0) {
-          setSelectedScenario(items[0]);
+          const detail = await scenarioAPI.get(items[0].scenario_id);
+          setSelectedScenario(detail.data);
         }
       } catch (err) {
         setError('Failed to load scenarios');
@@ -146,7 +148,7 @@ const Scenarios: React.FC = () => {
         await scenarioAPI.create(newScenarioData);
 
         // Refresh the scenario list to show the new scenario
-        const scenariosResponse = await scenarioAPI.list();
+        const scenariosResponse = await scenarioAPI.listSummaries();
         setScenarios(scenariosResponse.data ?? []);
 
         // Select the newly created scenario
@@ -39,6 +39,9 @@ export interface GameSessionSummary {
     event_title: string;
     event_description: string;
   }>;
+  timeline_count?: number;
+  // Up to SESSION_PREVIEW_LENGTH + 1 characters; longer means the scene was cut
+  last_scene_preview?: string;
 }
 
 export interface GameSessionPayload {